@@ -14,6 +14,9 @@ import itertools
 
 def pairwise(span):
     """s -> (s0, s1), (s1, s2), (s2, s3), ..."""
+    # itertools.pairwise is available from Python 3.10.
+    if hasattr(itertools, 'pairwise'):
+        return list(itertools.pairwise(span))
     a, b = itertools.tee(span)
     next(b, None)
     zipped = zip(a, b)
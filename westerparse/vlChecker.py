@@ -103,6 +103,9 @@ or :py:func:'fourthSpeciesControlOfDissonance'.
 
 import unittest
 import logging
+import bisect
+import itertools
+from collections import namedtuple
 
 from music21 import *
 
@@ -133,9 +136,169 @@ allowSecondSpeciesBreak = True
 allowThirdSpeciesInsertions = True  # currently not in use
 sonorityCheck = False
 
-# Create lists to collect errors and advice, for reporting to user.
-vlErrors = []
-vlAdvice = []
+# Errors and advice, for reporting to user, are collected in lists on the
+# context being checked, context.vlErrors and context.vlAdvice, which
+# checkCounterpoint creates afresh for each check.
+# Errors are recorded as (code, args) pairs and are rendered as text
+# from the errorTemplates only when reported; see addError and
+# renderError.
+
+# Error message templates, by error code:
+errorTemplates = {
+    # control of dissonance
+    'coinitiatedDissonance':
+        'Dissonance between co-initiated notes in bar {0}: {1}.',
+    'offbeatDissonanceNotStepwise':
+        'Dissonant interval off the beat that is not approached and left '
+        'by step in bar {0}: {1}.',
+    'consecutiveDissonanceDirection':
+        'Consecutive dissonant intervals in bar {0} are not approached '
+        'and left in the same direction.',
+    # control of dissonance in fourth species
+    'onbeatDissonanceUntreated':
+        'Dissonant interval on the beat that is either not prepared or '
+        'not resolved in bar {0}: {1}.',
+    'onbeatDissonanceInBrokenSpecies':
+        'Dissonant interval on the beat that is not permitted when fourth '
+        'species is broken in bar {0}: {1}.',
+    'offbeatDissonance':
+        'Dissonant interval off the beat in bar {0}: {1}.',
+    'speciesBreakNotAtEnd':
+        'Breaking of fourth species is allowed only at the end and not in '
+        'bars {0} to {1}.',
+    'speciesBreakRepeated':
+        'Breaking of fourth species is only allowed once during the '
+        'exercise.',
+    'speciesBreakTooEarly':
+        'Breaking of fourth species in bars {0} to {1} occurs too early.',
+    'speciesBreakTooLate':
+        'Breaking of fourth species in bars {0} to {1} occurs too late.',
+    'brokenSpeciesDissonanceNotStepwise':
+        'Dissonance off the beat in bar {0} is not approached and left '
+        'by step.',
+    'syncopeNotPermitted':
+        'The dissonant syncopation in bar {0} is not permitted: {1}.',
+    # forbidden motions onto the beat
+    'similarToUnison':
+        'Forbidden similar motion to unison going into bar {0}.',
+    'similarFromUnison':
+        'Forbidden similar motion from unison in bar {0}.',
+    'similarToOctave':
+        'Forbidden similar motion to octave going into bar {0}.',
+    'similarToFifth':
+        'Forbidden similar motion to fifth going into bar {0}.',
+    'parallelToUnison':
+        'Forbidden parallel motion to unison going into bar {0}.',
+    'parallelToOctave':
+        'Forbidden parallel motion to octave going into bar {0}.',
+    'parallelToFifth':
+        'Forbidden parallel motion to fifth going into bar {0}.',
+    'voiceCrossingInBar':
+        'Voice crossing in bar {0}.',
+    'voiceCrossingIntoBar':
+        'Voice crossing going into bar {0}.',
+    'upperVoicesCrossInBar':
+        'ALERT: Upper voices cross in bar {0}.',
+    'upperVoicesCrossIntoBar':
+        'ALERT: Upper voices cross going into bar {0}.',
+    'voiceOverlap':
+        'Voice overlap going into bar {0}.',
+    'upperVoicesOverlap':
+        'ALERT: Upper voices overlap going into bar {0}.',
+    'crossRelation':
+        'Cross relation going into bar {0}.',
+    # forbidden motions between beats
+    'parallelToUnisonFromBar':
+        'Forbidden parallel motion to unison from bar {0} to bar {1}.',
+    'parallelToOctaveFromBar':
+        'Forbidden parallel motion to octave from bar {0} to bar {1}.',
+    'parallelToFifthBetweenDownbeats':
+        'Forbidden parallel motion to pefect fifth from the downbeat of '
+        'bar {0} to the downbeat of bar {1}.',
+    'parallelBetweenDownbeats':
+        'Forbidden parallel motion from the downbeat of bar {0} to the '
+        'downbeat of bar {1}.',
+    'parallelOctavesFromOffbeat':
+        'Forbidden parallel octaves from an offbeat note in bar {0} to '
+        'the downbeat of bar {1}.',
+    # forbidden motions in fourth species
+    'syncopatedParallelToUnison':
+        'Forbidden parallel motion to unison going into bar {0}',
+    'syncopatedParallelToOctave':
+        'Forbidden parallel motion to octave going into bar {0}',
+    # nonconsecutive parallels
+    'nonconsecutiveParallels':
+        'Non-consecutive parallel {0} in bars {1} and {2}.',
+    'offbeatUnisons':
+        'Offbeat unisons in bars {0} and {1}',
+    'offbeatOctaves':
+        'Offbeat octaves in bars {0} and {1}',
+    # consecutions
+    'directRepetition':
+        'Direct repetition in bar {0}.',
+    'directRepetitionAroundBar':
+        'Direct repetition around bar {0}.',
+    'pitchNotTied':
+        'Pitch not tied across the barline into bar {0}.',
+    # fourth leaps in the bass
+    'fourthLeapInBar':
+        'Prohibited leap of a fourth in bar {0}.',
+    'fourthLeapAcrossBars':
+        'Prohibited leap of a fourth in bars {0}-{1}.',
+}
+
+# Westergaard's lists of suspensions, by type:
+strongSuspensions = {'upper': frozenset(['d7-6', 'm7-6', 'M7-6']),
+                     'lower': frozenset(['m2-3', 'M2-3', 'A2-3'])}
+intermediateSuspensions = {'upper': frozenset(['m9-8', 'M9-8', 'd4-3',
+                                               'P4-3', 'A4-3']),
+                           'lower': frozenset(['A4-5', 'd5-6', 'A5-6'])}
+weakSuspensions = {'upper': frozenset(['m2-1', 'M2-1']),
+                   'lower': frozenset(['m7-8', 'M7-8', 'P4-5'])}
+# Suspensions permitted in fourth species (strong and intermediate):
+permittedSuspensions = {
+    'upper': strongSuspensions['upper'] | intermediateSuspensions['upper'],
+    'lower': strongSuspensions['lower'] | intermediateSuspensions['lower']}
+# Dissonances inferred from Westergaard's lists:
+suspensionDissonances = frozenset(['m2', 'M2', 'A2', 'd4', 'P4', 'A4',
+                                   'A5', 'd5', 'm7', 'd7', 'M7'])
+# Names of compound seconds, reduced to ninths:
+ninthNames = {'m2': 'm9', 'M2': 'M9', 'A2': 'A9'}
+# Simple names of intervals that are steps by pitch class:
+stepClassNames = frozenset(['m2', 'M2', 'm7', 'M7'])
+# Simple names of vertical consonances, and of the dissonances permitted
+# between upper parts:
+verticalConsonanceNames = frozenset(['P1', 'P5', 'P8',
+                                     'm3', 'M3', 'm6', 'M6'])
+permittedUpperDissonanceNames = frozenset(['P4', 'A4', 'd5'])
+# Semitone classes of the consonances above the bass (P1, m3, M3, P5,
+# m6, M6), which are shared by some dissonances (A2, d4, A5, d7):
+consonantSemitones = frozenset([0, 3, 4, 7, 8, 9])
+# Simple names of the consonances above the bass, and of the perfect
+# and imperfect vertical consonances, with their semitone classes:
+consonanceAboveBassNames = frozenset(['P1', 'm3', 'M3', 'P5', 'm6', 'M6'])
+perfectConsonanceNames = frozenset(['P1', 'P5', 'P8'])
+perfectSemitones = frozenset([0, 7])
+imperfectConsonanceNames = frozenset(['m3', 'M3', 'm6', 'M6'])
+imperfectSemitones = frozenset([3, 4, 8, 9])
+# Simple names of the intervals in consonant triads, and in all triads:
+triadicConsonanceNames = frozenset(['P1', 'm3', 'M3', 'P4',
+                                    'P5', 'm6', 'M6'])
+triadicIntervalNames = triadicConsonanceNames | {'A4', 'd5'}
+triadicConsonantSemitones = consonantSemitones | {5}
+# Simple names of the intervals that do not displace (see isDisplaced):
+undisplacingNames = triadicConsonanceNames | {'P8'}
+# Names of diatonic steps, and of octaves (simple or compound):
+diatonicStepNames = frozenset(['m2', 'M2'])
+octaveNames = frozenset(['P8', 'P15', 'P22'])
+
+# Interval names, by diatonic and chromatic distance between two pitches;
+# see getIntervalNames.
+IntervalNames = namedtuple('IntervalNames',
+                           ['name', 'simpleName', 'semiSimpleName'])
+intervalNameCache = {}
+# Pairs of part numbers, by number of parts; see getAllPartNumPairs.
+partNumPairsCache = {}
 
 
 # -----------------------------------------------------------------------------
@@ -159,6 +322,9 @@ def checkCounterpoint(context, report=True):
     # Each pairing has its own subroutines:
     #     1:1; 1:2; 1:3 and 1:4; and syncopated
 
+    context.vlErrors = []
+    context.vlAdvice = []
+    context.consecutionsChecked = False
     twoPartContexts = context.makeTwoPartContexts()
     for duet in twoPartContexts:
         checkDuet(context, duet)
@@ -166,47 +332,66 @@ def checkCounterpoint(context, report=True):
 
     # Report voice-leading errors, if asked.
     if report:
-        if not vlErrors:
+        if not context.vlErrors:
             result = ('No voice-leading errors found.\n')
         else:
             result = ('VOICE LEADING REPORT \nThe following '
-                      'voice-leading errors were found:')
-            for error in vlErrors:
-                result = result + '\n\t\t' + error
+                      'voice-leading errors were found:'
+                      + ''.join('\n\t\t' + renderError(error)
+                                for error in context.vlErrors))
         print(result)
         # Report sonority advice, if enabled.
         if sonorityCheck:
-            if not vlAdvice:
+            if not context.vlAdvice:
                 advice = None
-            elif vlAdvice:
+            elif context.vlAdvice:
                 advice = ('SONORITY ADVICE \nThe following '
-                          'situations may need attention:')
-                for item in vlAdvice:
-                    advice = advice + '\n\t' + item
+                          'situations may need attention:'
+                          + ''.join('\n\t' + item
+                                    for item in context.vlAdvice))
             if advice:
                 print(advice)
     else:
         pass
 
+
+def addError(context, code, *args):
+    """
+    Record a voice-leading error in the context being checked, as a code
+    and the arguments of its message template in
+    :py:data:`errorTemplates`.  The message is
+    composed only when the error is reported.
+    """
+    context.vlErrors.append((code, args))
+
+
+def renderError(error):
+    """
+    Compose the message for an error recorded by :py:func:`addError`.
+    """
+    code, args = error
+    return errorTemplates[code].format(*args)
+
+
 def checkDuet(context, duet):
     """
     Check the voice-leading of each duet, depending upon which simple
     species the pair represents (e.g., first, second, third, fourth).
     The function is not yet able to evaluate combined species.
     """
-    cond1 = duet.parts[0].species == 'first'
-    cond2 = duet.parts[1].species == 'first'
-    if cond1 and cond2:
-        checkFirstSpecies(context, duet)
-    if ((cond1 and duet.parts[1].species == 'second')
-            or (duet.parts[0].species == 'second' and cond2)):
-        checkSecondSpecies(context, duet)
-    if ((cond1 and duet.parts[1].species == 'third')
-            or (duet.parts[0].species == 'third' and cond2)):
-        checkThirdSpecies(context, duet)
-    if ((cond1 and duet.parts[1].species == 'fourth')
-            or (duet.parts[0].species == 'fourth' and cond2)):
-        checkFourthSpecies(context, duet)
+    # Look up the metrical and melodic data of the notes once.
+    primeNoteData(context)
+    # Look up the check for the pair of species, in either order.
+    speciesPair = frozenset(part.species for part in duet.parts)
+    checkSpecies = speciesChecks.get(speciesPair)
+    if checkSpecies is None:
+        return
+    # Gather the vertical pairs and voice-leading quartets once and
+    # share them among the rule checks.
+    offsets = getOffsetList(duet)
+    vPairs, VLQs = getVerticalPairsAndVLQs(duet, offsets)
+    vlqTable = VLQTable(VLQs, vPairs, offsets)
+    checkSpecies(context, duet, vlqTable)
     # TODO Add pairs for combined species: Westergaard chapter 6:
     # second and second
     # third and third
@@ -216,19 +401,18 @@ def checkDuet(context, duet):
     # third and fourth
 
 
-def checkFirstSpecies(context, duet):
+def checkFirstSpecies(context, duet, vlqTable):
     """
     Check a duet, where both lines are in first species.
     Evaluate control of dissonance and forbidden forms of motion.
     """
-    VLQs = getAllVLQsFromDuet(duet)
-    checkFirstSpeciesForbiddenMotions(context, duet, VLQs)
-    checkControlOfDissonance(context, duet, VLQs)
+    checkFirstSpeciesForbiddenMotions(context, duet, vlqTable.VLQs)
+    checkControlOfDissonance(context, duet, vlqTable)
     if sonorityCheck and len(context.parts) == 2:
         checkFirstSpeciesSonority(context, duet)
 
 
-def checkSecondSpecies(context, duet):
+def checkSecondSpecies(context, duet, vlqTable):
     """
     Check a duet, where one line is in first species
     and the other is in second species.
@@ -237,15 +421,13 @@ def checkSecondSpecies(context, duet):
     Evaluate control of dissonance and forbidden forms of motion,
     including the rules for nonconsecutive unisons and octaves.
     """
-    VLQs = getAllVLQsFromDuet(duet)
     checkConsecutions(context)
-    checkSecondSpeciesForbiddenMotions(context, duet, VLQs)
-    checkControlOfDissonance(context, duet, VLQs)
-    checkSecondSpeciesNonconsecutiveUnisons(duet)
-    checkSecondSpeciesNonconsecutiveOctaves(duet)
+    checkSecondSpeciesForbiddenMotions(context, duet, vlqTable.VLQs)
+    checkControlOfDissonance(context, duet, vlqTable)
+    checkSecondSpeciesNonconsecutiveParallels(context, duet, vlqTable.vPairs)
 
 
-def checkThirdSpecies(context, duet):
+def checkThirdSpecies(context, duet, vlqTable):
     """
     Check a duet, where one line is in first species
     and the other is in third species.
@@ -253,13 +435,12 @@ def checkThirdSpecies(context, duet):
     in the third species line).
     Evaluate control of dissonance and forbidden forms of motion.
     """
-    VLQs = getAllVLQsFromDuet(duet)
     checkConsecutions(context)
-    checkThirdSpeciesForbiddenMotions(context, duet, VLQs)
-    checkControlOfDissonance(context, duet, VLQs)
+    checkThirdSpeciesForbiddenMotions(context, duet, vlqTable.VLQs)
+    checkControlOfDissonance(context, duet, vlqTable)
 
 
-def checkFourthSpecies(context, duet):
+def checkFourthSpecies(context, duet, vlqTable):
     """
     Check a duet, where one line is in first species
     and the other is in fourth species.
@@ -268,9 +449,17 @@ def checkFourthSpecies(context, duet):
     Evaluate control of dissonance and forbidden forms of motion.
     """
     checkConsecutions(context)
-    VLQs = getAllVLQsFromDuet(duet)
-    checkFourthSpeciesForbiddenMotions(context, duet, VLQs)
-    checkFourthSpeciesControlOfDissonance(context, duet, VLQs)
+    checkFourthSpeciesForbiddenMotions(context, duet, vlqTable.VLQs,
+                                       vlqTable.vPairs)
+    checkFourthSpeciesControlOfDissonance(context, duet, vlqTable)
+
+
+# Checks for each simple species pairing, by the set of species in the duet;
+# see checkDuet.
+speciesChecks = {frozenset(['first']): checkFirstSpecies,
+                 frozenset(['first', 'second']): checkSecondSpecies,
+                 frozenset(['first', 'third']): checkThirdSpecies,
+                 frozenset(['first', 'fourth']): checkFourthSpecies}
 
 
 # -----------------------------------------------------------------------------
@@ -278,7 +467,7 @@ def checkFourthSpecies(context, duet):
 # -----------------------------------------------------------------------------
 
 
-def checkControlOfDissonance(context, duet, VLQs):
+def checkControlOfDissonance(context, duet, vlqTable):
     """
     Check a duet for conformity with the rules that control
     dissonance in first, second, or third species. Requires access not only
@@ -293,20 +482,15 @@ def checkControlOfDissonance(context, duet, VLQs):
     and left by step in the same direction.
     """
     # Get the list of event offsets.
-    eventOffsets = getOffsetList(duet)
-    # Construct vertical dictionaries for every offset and evaluate for
-    # control of dissonance. Get bass note, if not included in duet.
+    eventOffsets = vlqTable.offsets
+    # Look up the notes (or rests) of the duet at every offset and
+    # evaluate for control of dissonance. Get bass note, if not included
+    # in duet.
+    upperPart = duet.parts[0]
+    lowerPart = duet.parts[1]
     for offset in eventOffsets:
-        contentDict = getVerticalityContentDictFromDuet(duet, offset)
-        upperNote = contentDict[0]
-        lowerNote = contentDict[1]
-        if not duet.includesBass:
-            bassNotes = [el for el in
-                         context.parts[-1].flatten().notes.getElementsByOffset(
-                             offset, mustBeginInSpan=False)]
-            bassNote = bassNotes[0]
-        else:
-            bassNote = lowerNote
+        upperNote = getNoteOrRestAtOffset(upperPart, offset)
+        lowerNote = getNoteOrRestAtOffset(lowerPart, offset)
 
         # Do not evaluate a simultaneity if one note is a rest.
         # TODO This is okay for now, but need to check
@@ -319,101 +503,74 @@ def checkControlOfDissonance(context, duet, VLQs):
             continue
 
         # Rules for co-initiated simultaneities.
-        # (1) Both notes start at the same time, neither is tied over:
-        rules1 = [upperNote.beat == lowerNote.beat,
-                  (upperNote.tie is None or upperNote.tie.type == 'start'),
-                  (lowerNote.tie is None or lowerNote.tie.type == 'start')]
-        # (2a) The pair constitutes a permissible consonance above the bass:
-        rules2a = [duet.includesBass,
-                   isConsonanceAboveBass(lowerNote, upperNote)]
-        # (2b) The pair constitutes a permissible consonance between upper parts:
-        rules2b = [not duet.includesBass,
-                   isConsonanceBetweenUpper(lowerNote, upperNote)]
-        # (2c) The pair is a permissible dissonance between upper parts:
-        # TODO This won't work if the bass is a rest and not a note.
-        rules2c = [not duet.includesBass,
-                   isPermittedDissonanceBetweenUpper(lowerNote, upperNote),
-                   isThirdOrSixthAboveBass(bassNote, upperNote),
-                   isThirdOrSixthAboveBass(bassNote, lowerNote)]
+        # (1) Both notes start at the same time, neither is tied over.
+        # Co-initiated notes that are tied over are not evaluated.
+        coinitiated = upperNote.vlData.beat == lowerNote.vlData.beat
+        if (coinitiated
+                and not ((upperNote.tie is None
+                          or upperNote.tie.type == 'start')
+                         and (lowerNote.tie is None
+                              or lowerNote.tie.type == 'start'))):
+            continue
+
+        # (2a) The pair constitutes a permissible consonance above the bass.
+        if duet.includesBass:
+            if isConsonanceAboveBass(lowerNote, upperNote):
+                continue
+        # (2b) The pair constitutes a permissible consonance between
+        # upper parts.
+        elif isConsonanceBetweenUpper(lowerNote, upperNote):
+            continue
+        # (2c) The pair is a permissible dissonance between upper parts.
+        elif isPermittedDissonanceBetweenUpper(lowerNote, upperNote):
+            bassNote = getNoteAtOffset(context.parts[-1], offset)
+            if (bassNote is not None
+                    and isThirdOrSixthAboveBass(bassNote, upperNote)
+                    and isThirdOrSixthAboveBass(bassNote, lowerNote)):
+                continue
 
         # Test co-initiated simultaneities.
-        if (all(rules1) and not (all(rules2a)
-                                 or all(rules2b)
-                                 or all(rules2c))):
-            error = ('Dissonance between co-initiated notes in bar '
-                     + str(upperNote.measureNumber) + ': '
-                     + str(interval.Interval(lowerNote, upperNote).name)
-                     + '.')
-            vlErrors.append(error)
+        if coinitiated:
+            addError(context, 'coinitiatedDissonance', upperNote.measureNumber,
+                     getIntervalNames(lowerNote, upperNote).name)
+            continue
 
         # Rules for non-co-initiated simultaneities.
         # (3) One note starts after the other and is neither consonant
-        # nor included among the permissible dissonances:
-        rules3 = [upperNote.beat != lowerNote.beat,
-                  not (all(rules2a) or all(rules2b) or all(rules2c))]
-        # (4) Upper note is later.
-        rules4 = [upperNote.beat > lowerNote.beat]
-        # (5a) The upper note is approached and left by step.
-        rules5a = [upperNote.consecutions.leftType == 'step',
-                   upperNote.consecutions.rightType == 'step']
-        # (5b) The lower note is approached and left by step.
-        rules5b = [lowerNote.consecutions.leftType == 'step',
-                   lowerNote.consecutions.rightType == 'step']
-
-        # Test non-co-initiated sumultaneities.
-        if (all(rules3) and ((all(rules4) and not all(rules5a))
-                             or (not all(rules4) and not all(rules5b)))):
-            error = ('Dissonant interval off the beat that is not '
-                     'approached and left by step in bar '
-                     + str(lowerNote.measureNumber) + ': '
-                     + str(interval.Interval(lowerNote, upperNote).name)
-                     + '.')
-            vlErrors.append(error)
+        # nor included among the permissible dissonances.
+        # (4) If the upper note is later, (5a) it must be approached
+        # and left by step; otherwise (5b) the lower note must be.
+        if upperNote.vlData.beat > lowerNote.vlData.beat:
+            laterNote = upperNote
+        else:
+            laterNote = lowerNote
+        if not (laterNote.vlData.leftType == 'step'
+                and laterNote.vlData.rightType == 'step'):
+            addError(context, 'offbeatDissonanceNotStepwise',
+                     lowerNote.measureNumber,
+                     getIntervalNames(lowerNote, upperNote).name)
 
         # Both notes start at the same time, both of them are tied over:
         # TODO ???
 
     # Check whether consecutive dissonances move in one direction.
-    for vlq in VLQs:
+    t = vlqTable
+    for i in range(len(t)):
         # Rules for finding consecutive dissonances:
-        # (1a) Either both of the intervals are dissonant above the bass:
-        rules1a = [duet.includesBass,
-                   isVerticalDissonance(vlq.v1n1, vlq.v2n1),
-                   isVerticalDissonance(vlq.v1n2, vlq.v2n2)]
-        # (1b) Or both of the intervals are prohibited dissonances
-        # between upper parts:
-        rules1b = [not duet.includesBass,
-                   isVerticalDissonance(vlq.v1n1, vlq.v2n1),
-                   not isPermittedDissonanceBetweenUpper(vlq.v1n1,
-                                                         vlq.v2n1),
-                   isVerticalDissonance(vlq.v1n2, vlq.v2n2),
-                   not isPermittedDissonanceBetweenUpper(vlq.v1n2,
-                                                         vlq.v2n2)]
-        # (2a) Either the first voice is stationary and
-        # the second voice moves in one direction:
-        rules2a = [vlq.v1n1 == vlq.v1n2,
-                   (vlq.v2n1.consecutions.leftDirection
-                    == vlq.v2n2.consecutions.leftDirection),
-                   (vlq.v2n1.consecutions.rightDirection
-                    == vlq.v2n2.consecutions.rightDirection)]
-        # (2b) Or the second voice is stationary and
-        # the first voice moves in one direction:
-        rules2b = [vlq.v2n1 == vlq.v2n2,
-                   (vlq.v1n1.consecutions.leftDirection
-                    == vlq.v1n2.consecutions.leftDirection),
-                   (vlq.v1n1.consecutions.rightDirection
-                    == vlq.v1n2.consecutions.rightDirection)]
-        # (3) Must be in the same measure:
-        rules3 = [vlq.v1n1.measureNumber == vlq.v1n2.measureNumber]
-        # Evaluate the VLQ.
-        if ((all(rules1a) or all(rules1b))
-                and not (all(rules2a) or all(rules2b))
-                and (all(rules3))):
-            error = ('Consecutive dissonant intervals in bar '
-                     + str(vlq.v1n1.measureNumber)
-                     + ' are not approached and left '
-                       'in the same direction.')
-            vlErrors.append(error)
+        # (1a) Either both of the intervals are dissonant above the bass,
+        # (1b) or both of the intervals are prohibited dissonances
+        # between upper parts.
+        if not (t.vDissonant1[i] and t.vDissonant2[i]):
+            continue
+        if not duet.includesBass and (t.vPermittedUpper1[i]
+                                      or t.vPermittedUpper2[i]):
+            continue
+        # (2) Must be in the same measure, and (3) unless one voice is
+        # stationary and the other moves in one direction
+        # (see VLQTable.movesOneWay), the VLQ is in error.
+        if t.v1n1Measures[i] == t.v1n2Measures[i] and not t.movesOneWay[i]:
+            addError(context, 'consecutiveDissonanceDirection',
+                     t.v1n1Measures[i])
 
     # TODO Fix so that it works with higher species
     #   line that start with rests in the bass. ????
@@ -428,7 +585,7 @@ def checkControlOfDissonance(context, duet, VLQs):
     # TODO Add contiguous intervals to vlqs ?? xint1, xint2.
 
 
-def checkFourthSpeciesControlOfDissonance(context, duet, VLQs):
+def checkFourthSpeciesControlOfDissonance(context, duet, vlqTable):
     """
     Check the duet for conformity the rules that
     control dissonance in fourth species.
@@ -438,167 +595,120 @@ def checkFourthSpeciesControlOfDissonance(context, duet, VLQs):
     elif duet.parts[1].species == 'fourth':
         speciesPart = 1
 
-    for vPair in getVerticalPairs(duet):
+    for vPair in vlqTable.vPairs:
         # Evaluate on- and offbeat intervals when one of the parts
         # is the bass.
         if duet.includesBass:
+            speciesNote = vPair[speciesPart]
+            onbeat = speciesNote.vlData.beat == 1.0
+            if not (onbeat or speciesNote.vlData.beat > 1.0):
+                continue
+            if isConsonanceAboveBass(vPair[1], vPair[0]):
+                continue
             # Look for onbeat note that is dissonant
             # and improperly treated.
-            rules = [
-                vPair[speciesPart].beat == 1.0,
-                not isConsonanceAboveBass(vPair[1], vPair[0]),
-                not vPair[speciesPart].consecutions.leftType == 'same',
-                not vPair[speciesPart].consecutions.rightType == 'step'
-            ]
-            if all(rules):
-                error = ('Dissonant interval on the beat that is '
-                         'either not prepared or not resolved in bar '
-                         + str(vPair[0].measureNumber) + ': '
-                         + str(interval.Interval(vPair[0], vPair[1]).name)
-                         + '.')
-                vlErrors.append(error)
+            if (onbeat
+                    and speciesNote.vlData.leftType != 'same'
+                    and speciesNote.vlData.rightType != 'step'):
+                addError(context, 'onbeatDissonanceUntreated',
+                         vPair[0].measureNumber,
+                         getIntervalNames(vPair[0], vPair[1]).name)
             # Look for second-species onbeat dissonance.
-            rules = [vPair[speciesPart].beat == 1.0,
-                     vPair[speciesPart].tie is None,
-                     not isConsonanceAboveBass(vPair[1], vPair[0])]
-            if all(rules):
-                error = ('Dissonant interval on the beat that is not '
-                         'permitted when fourth species is broken in bar '
-                         + str(vPair[0].measureNumber) + ': '
-                         + str(interval.Interval(vPair[1], vPair[0]).name)
-                         + '.')
-                vlErrors.append(error)
+            if onbeat and speciesNote.tie is None:
+                addError(context, 'onbeatDissonanceInBrokenSpecies',
+                         vPair[0].measureNumber,
+                         getIntervalNames(vPair[1], vPair[0]).name)
             # Look for offbeat note that is dissonant and tied over.
-            rules = [vPair[speciesPart].beat > 1.0,
-                     not isConsonanceAboveBass(vPair[1], vPair[0]),
-                     vPair[0].tie is not None or vPair[1].tie is not None]
-            if all(rules):
-                error = ('Dissonant interval off the beat in bar '
-                         + str(vPair[0].measureNumber) + ': '
-                         + str(interval.Interval(vPair[1], vPair[0]).name)
-                         + '.')
-                vlErrors.append(error)
+            if (not onbeat
+                    and (vPair[0].tie is not None
+                         or vPair[1].tie is not None)):
+                addError(context, 'offbeatDissonance', vPair[0].measureNumber,
+                         getIntervalNames(vPair[1], vPair[0]).name)
         # TODO Need to figure out rules for 3 or more parts.
         elif not duet.includesBass:
             pass
 
     # Determine whether breaking of species is permitted,
     # and, if so, whether proper.
+    t = vlqTable
+    totalMeasures = context.score.measures
+    penultimateMeasure = totalMeasures - 1
     breakcount = 0
     earliestBreak = 4
-    latestBreak = context.score.measures - 4
-    for vlq in VLQs:
+    latestBreak = totalMeasures - 4
+    for i, vlq in enumerate(t.VLQs):
         # Look for vlq where second note in species line is not tied over.
         if speciesPart == 0:
             speciesNote = vlq.v1n2
         elif speciesPart == 1:
             speciesNote = vlq.v2n2
-        if speciesNote.tie is None and speciesNote.beat > 1.0:
+        if speciesNote.tie is None and speciesNote.vlData.beat > 1.0:
             if (not allowSecondSpeciesBreak
-                    and speciesNote.measureNumber != context.score.measures - 1):
-                error = ('Breaking of fourth species is allowed only '
-                         'at the end and not in bars '
-                         + str(speciesNote.measureNumber) + ' to '
-                         + str(speciesNote.measureNumber + 1) + '.')
-                vlErrors.append(error)
+                    and speciesNote.measureNumber != penultimateMeasure):
+                addError(context, 'speciesBreakNotAtEnd',
+                         speciesNote.measureNumber,
+                         speciesNote.measureNumber + 1)
             elif (allowSecondSpeciesBreak
-                  and speciesNote.measureNumber != context.score.measures - 1):
-                rules = [earliestBreak < speciesNote.measureNumber
-                         < latestBreak,
-                         breakcount < 1]
-                if all(rules):
+                  and speciesNote.measureNumber != penultimateMeasure):
+                if (breakcount < 1
+                        and earliestBreak < speciesNote.measureNumber
+                        < latestBreak):
                     breakcount += 1
                 elif breakcount >= 1:
-                    error = ('Breaking of fourth species is only '
-                             'allowed once during the exercise.')
-                    vlErrors.append(error)
+                    addError(context, 'speciesBreakRepeated')
                 elif earliestBreak > speciesNote.measureNumber:
-                    error = ('Breaking of fourth species in bars '
-                             + str(speciesNote.measureNumber)
-                             + ' to ' + str(speciesNote.measureNumber + 1)
-                             + ' occurs too early.')
-                    vlErrors.append(error)
+                    addError(context, 'speciesBreakTooEarly',
+                             speciesNote.measureNumber,
+                             speciesNote.measureNumber + 1)
                 elif speciesNote.measureNumber > latestBreak:
-                    error = ('Breaking of fourth species in bars '
-                             + str(speciesNote.measureNumber)
-                             + ' to ' + str(speciesNote.measureNumber + 1)
-                             + ' occurs too late.')
-                    vlErrors.append(error)
+                    addError(context, 'speciesBreakTooLate',
+                             speciesNote.measureNumber,
+                             speciesNote.measureNumber + 1)
                 # If the first vInt is dissonant, the speciesNote
                 # will be checked later.
                 # If the first vInt is consonant, the speciesNote
                 # might be dissonant.
-                cond1 = [isVerticalDissonance(vlq.v1n2, vlq.v2n2)]
-                cond2 = [not isVerticalDissonance(vlq.v1n1, vlq.v2n1),
-                         speciesNote.consecutions.leftType == 'step',
-                         speciesNote.consecutions.rightType == 'step']
-                if all(cond1) and not all(cond2):
-                    logger.debug(f'{isVerticalDissonance(vlq.v1n1, vlq.v2n1)}'
-                                 f'{isVerticalDissonance(vlq.v1n2, vlq.v2n2)}'
-                                 )
-                    error = ('Dissonance off the beat in bar '
-                             + str(speciesNote.measureNumber)
-                             + ' is not approached and left by step.')
-                    vlErrors.append(error)
-
-    # Westergaard's lists of suspensions, by type:
-    strongSuspensions = {'upper': ['d7-6', 'm7-6', 'M7-6'],
-                         'lower': ['m2-3', 'M2-3', 'A2-3']}
-    intermediateSuspensions = {'upper': ['m9-8', 'M9-8', 'd4-3',
-                                         'P4-3', 'A4-3'],
-                               'lower': ['A4-5', 'd5-6', 'A5-6']}
-    weakSuspensions = {'upper': ['m2-1', 'M2-1'],
-                       'lower': ['m7-8', 'M7-8', 'P4-5']}
-    # List of dissonances inferred from Westergaard lists:
-    validDissonances = ['m2', 'M2', 'A2', 'd4', 'P4', 'A4',
-                        'A5', 'd5', 'A5', 'm7', 'd7', 'M7']
+                if t.vDissonant2[i] and not (
+                        not t.vDissonant1[i]
+                        and speciesNote.vlData.leftType == 'step'
+                        and speciesNote.vlData.rightType == 'step'):
+                    logger.debug(f'{t.vDissonant1[i]}{t.vDissonant2[i]}')
+                    addError(context, 'brokenSpeciesDissonanceNotStepwise',
+                             speciesNote.measureNumber)
 
     # Function for distinguishing between intervals 9 and 2 in upper lines.
     def dissName(ivl):
-        if (ivl.simpleName in ['m2', 'M2', 'A2']
-                and ivl.name not in ['m2', 'M2', 'A2']):
-            intervalName = interval.add([ivl.simpleName, 'P8']).name
+        simpleName = ivl.simpleName
+        if simpleName in ninthNames and ivl.name != simpleName:
+            intervalName = ninthNames[simpleName]
         else:
-            intervalName = ivl.simpleName
+            intervalName = simpleName
         return intervalName
 
     # Make list of dissonant syncopes and verify that each is permitted.
     syncopeList = {}
-    for vlq in VLQs:
+    for i in range(len(t)):
         if speciesPart == 0:
-            if vlq.v1n1.tie:
-                if vlq.v1n1.tie.type == 'stop':
-                    if vlq.vIntervals[0].simpleName in validDissonances:
-                        syncopeList[vlq.v1n1.measureNumber] = (
-                                dissName(vlq.vIntervals[0])
-                                + '-' + vlq.vIntervals[1].semiSimpleName[-1]
-                        )
+            if t.v1n1TieTypes[i] == 'stop':
+                if t.vSimpleNames1[i] in suspensionDissonances:
+                    syncopeList[t.v1n1Measures[i]] = (
+                            dissName(t.VLQs[i].vIntervals[0])
+                            + '-' + t.vSemiSimpleNames2[i][-1]
+                    )
         elif speciesPart == 1:
-            if vlq.v2n1.tie:
-                if vlq.v2n1.tie.type == 'stop':
-                    if vlq.vIntervals[0].simpleName in validDissonances:
-                        syncopeList[vlq.v2n1.measureNumber] = (
-                                vlq.vIntervals[0].simpleName
-                                + '-' + vlq.vIntervals[1].semiSimpleName[-1]
-                        )
+            if t.v2n1TieTypes[i] == 'stop':
+                if t.vSimpleNames1[i] in suspensionDissonances:
+                    syncopeList[t.v2n1Measures[i]] = (
+                            t.vSimpleNames1[i]
+                            + '-' + t.vSemiSimpleNames2[i][-1]
+                    )
     if speciesPart == 0:
-        for bar in syncopeList:
-            if (syncopeList[bar] not in strongSuspensions['upper']
-                    and syncopeList[bar] not in intermediateSuspensions[
-                        'upper']):
-                error = ('The dissonant syncopation in bar '
-                         + str(bar) + ' is not permitted: '
-                         + str(syncopeList[bar]) + '.')
-                vlErrors.append(error)
+        permitted = permittedSuspensions['upper']
     elif speciesPart == 1:
-        for bar in syncopeList:
-            if (syncopeList[bar] not in strongSuspensions['lower']
-                    and syncopeList[bar] not in intermediateSuspensions[
-                        'lower']):
-                error = ('The dissonant syncopation in bar '
-                         + str(bar) + ' is not permitted: '
-                         + str(syncopeList[bar]) + '.')
-                vlErrors.append(error)
+        permitted = permittedSuspensions['lower']
+    for bar in syncopeList:
+        if syncopeList[bar] not in permitted:
+            addError(context, 'syncopeNotPermitted', bar, syncopeList[bar])
     # logger.debug(f'Syncopes list: {syncopeList}.')
 
 
@@ -612,114 +722,89 @@ def checkForbiddenMotionsOntoBeatWithoutSyncope(context, duet, vlq):
        * parallel motion to unison, octave, or fifth
        * voice crossing, voice overlap, cross relation
     """
-    # get the bass note in the second verticality of the vlq
-    vlqBassNote = \
-    context.parts[-1].measure(vlq.v1n2.measureNumber).getElementsByClass(
-        'Note')[0]
     # check the types of forbidden motion
-    if isSimilarUnison(vlq):
-        error = ('Forbidden similar motion to unison going into bar '
-                 + str(vlq.v2n2.measureNumber) + '.')
-        vlErrors.append(error)
-    if isSimilarFromUnison(vlq):
-        error = ('Forbidden similar motion from unison in bar '
-                 + str(vlq.v2n1.measureNumber) + '.')
-        vlErrors.append(error)
-    if isSimilarOctave(vlq):
-        rules = [vlq.hIntervals[0].name in ['m2', 'M2'],
-                 vlq.v1n2.csd.value % 7 == 0,
-                 vlq.v1n2.measureNumber == context.score.measures,
-                 vlq.v2n2.measureNumber == context.score.measures]
-        if not all(rules):
-            error = ('Forbidden similar motion to octave going into bar '
-                     + str(vlq.v2n2.measureNumber) + '.')
-            vlErrors.append(error)
-    if isSimilarFifth(vlq):
-        rules1 = [vlq.hIntervals[0].name in ['m2', 'M2']]
-        rules2 = [vlq.v1n2.csd.value % 7 in [1, 4]]
-        # If fifth in upper parts, compare with pitch of the
-        # simultaneous bass note.
-        rules3 = [not duet.includesBass,
-                  vlq.v1n2.csd.value % 7 != vlqBassNote.csd.value % 7,
-                  vlq.v2n2.csd.value % 7 != vlqBassNote.csd.value % 7]
-        if not ((all(rules1) and all(rules2))
-                or (all(rules1) and all(rules3))):
-            error = ('Forbidden similar motion to fifth going into bar '
-                     + str(vlq.v2n2.measureNumber) + '.')
-            vlErrors.append(error)
-    if isParallelUnison(vlq):
-        error = ('Forbidden parallel motion to unison going into bar '
-                 + str(vlq.v2n2.measureNumber) + '.')
-        vlErrors.append(error)
-    if isParallelOctave(vlq):
-        error = ('Forbidden parallel motion to octave going into bar '
-                 + str(vlq.v2n2.measureNumber) + '.')
-        vlErrors.append(error)
-    if isParallelFifth(vlq):
-        error = ('Forbidden parallel motion to fifth going '
-                 'into bar ' + str(vlq.v2n2.measureNumber) + '.')
-        vlErrors.append(error)
+    # All of the similar and parallel motions are kinds of similar
+    # motion, so test for them only if the voices move in the same
+    # direction.
+    if vlq.similarMotion():
+        if isSimilarUnison(vlq):
+            addError(context, 'similarToUnison', vlq.v2n2.measureNumber)
+        if isSimilarFromUnison(vlq):
+            addError(context, 'similarFromUnison', vlq.v2n1.measureNumber)
+        if isSimilarOctave(vlq):
+            if not (vlq.v1n2.measureNumber == context.score.measures
+                    and vlq.v2n2.measureNumber == context.score.measures
+                    and vlq.v1n2.csd.value % 7 == 0
+                    and vlq.hIntervals[0].name in diatonicStepNames):
+                addError(context, 'similarToOctave', vlq.v2n2.measureNumber)
+        if isSimilarFifth(vlq):
+            # Approached by step and either (a) the upper note is scale
+            # degree 2 or 5, or (b) the fifth is in upper parts and neither
+            # note duplicates the simultaneous bass note.
+            permitted = False
+            if vlq.hIntervals[0].name in diatonicStepNames:
+                if vlq.v1n2.csd.value % 7 in [1, 4]:
+                    permitted = True
+                elif not duet.includesBass:
+                    # get the bass note in the second verticality of the vlq
+                    vlqBassNote = getFirstNoteInMeasure(
+                        context.parts[-1], vlq.v1n2.measureNumber)
+                    bassDegree = vlqBassNote.csd.value % 7
+                    permitted = (vlq.v1n2.csd.value % 7 != bassDegree
+                                 and vlq.v2n2.csd.value % 7 != bassDegree)
+            if not permitted:
+                addError(context, 'similarToFifth', vlq.v2n2.measureNumber)
+        parallel = getParallelInterval(vlq)
+        if parallel == 'P1':
+            addError(context, 'parallelToUnison', vlq.v2n2.measureNumber)
+        elif parallel == 'P8':
+            addError(context, 'parallelToOctave', vlq.v2n2.measureNumber)
+        elif parallel == 'P5':
+            addError(context, 'parallelToFifth', vlq.v2n2.measureNumber)
     if isVoiceCrossing(vlq):
         # Voice crossing can happen when both parts move or obliquely
         # Strict rule when the bass is involved.
         if duet.parts[0].parentID == len(context.parts) - 1 or duet.parts[
             1].parentID == len(context.parts) - 1:
-            if vlq.v1n1.beatStrength > vlq.v1n2.beatStrength:
-                error = f'Voice crossing in bar {vlq.v2n2.measureNumber}.'
+            if vlq.v1n1.vlData.beatStrength > vlq.v1n2.vlData.beatStrength:
+                addError(context, 'voiceCrossingInBar', vlq.v2n2.measureNumber)
             else:
-                error = (f'Voice crossing going into bar '
-                         f'{vlq.v2n2.measureNumber}.')
-            vlErrors.append(error)
+                addError(context, 'voiceCrossingIntoBar',
+                         vlq.v2n2.measureNumber)
         else:
-            if vlq.v1n1.beatStrength > vlq.v1n2.beatStrength:
-                alert = (f'ALERT: Upper voices cross in bar '
-                         f'{vlq.v2n2.measureNumber}.')
+            if vlq.v1n1.vlData.beatStrength > vlq.v1n2.vlData.beatStrength:
+                addError(context, 'upperVoicesCrossInBar',
+                         vlq.v2n2.measureNumber)
             else:
-                alert = (f'ALERT: Upper voices cross going into bar '
-                         f'{vlq.v2n2.measureNumber}.')
-            vlErrors.append(alert)
+                addError(context, 'upperVoicesCrossIntoBar',
+                         vlq.v2n2.measureNumber)
     if isVoiceOverlap(vlq):
         # Voice overlap can only happen with both parts move
         if duet.parts[0].parentID == len(context.parts) - 1 or duet.parts[
             1].parentID == len(context.parts) - 1:
-            error = ('Voice overlap going into bar '
-                     + str(vlq.v2n2.measureNumber) + ".")
-            vlErrors.append(error)
+            addError(context, 'voiceOverlap', vlq.v2n2.measureNumber)
         else:
-            alert = ('ALERT: Upper voices overlap going into bar '
-                     + str(vlq.v2n2.measureNumber) + '.')
-            vlErrors.append(alert)
+            addError(context, 'upperVoicesOverlap', vlq.v2n2.measureNumber)
     if isCrossRelation(vlq):
         # TODO add permissions for second (and third?) species, ITT, p. 115
         if len(context.parts) < 3:
-            cond1 = [duet.parts[0].species == 'second',
-                     isDiatonicStep(vlq.v1n1, vlq.v1n2)]
-            cond2 = [duet.parts[1].species == 'second',
-                     isDiatonicStep(vlq.v2n1, vlq.v2n2)]
-            if not (all(cond1) or all(cond2)):
-                error = ('Cross relation going into bar '
-                         + str(vlq.v2n2.measureNumber) + '.')
-                vlErrors.append(error)
+            if not ((duet.parts[0].species == 'second'
+                     and isDiatonicStep(vlq.v1n1, vlq.v1n2))
+                    or (duet.parts[1].species == 'second'
+                        and isDiatonicStep(vlq.v2n1, vlq.v2n2))):
+                addError(context, 'crossRelation', vlq.v2n2.measureNumber)
         else:
             # Test for step motion in another part.
             # TODO TEST TEST TEST
-            crossStep = False
-            for part in context.parts:
-                if (part != duet.parts[0]
-                        and part != duet.parts[1]):
-                    vlqOtherNote1 = \
-                    part.measure(vlq.v1n1.measureNumber).getElementsByClass(
-                        'Note')[0]
-                    vlqOtherNote2 = \
-                    part.measure(vlq.v1n2.measureNumber).getElementsByClass(
-                        'Note')[0]
-                    if vlqOtherNote1.csd.value - vlqOtherNote2.csd.value == 1:
-                        crossStep = True
-                        break
+            bar1 = vlq.v1n1.measureNumber
+            bar2 = vlq.v1n2.measureNumber
+            crossStep = any(
+                getFirstNoteInMeasure(part, bar1).csd.value
+                - getFirstNoteInMeasure(part, bar2).csd.value == 1
+                for part in context.parts
+                if part != duet.parts[0] and part != duet.parts[1])
             if not crossStep:
-                error = ('Cross relation going into bar '
-                         + str(vlq.v2n2.measureNumber) + '.')
-                vlErrors.append(error)
+                addError(context, 'crossRelation', vlq.v2n2.measureNumber)
 
 
 def checkFirstSpeciesForbiddenMotions(context, duet, VLQs):
@@ -744,56 +829,33 @@ def checkSecondSpeciesForbiddenMotions(context, duet, VLQs):
     # Check motion from beat to beat.
     vlqOnbeatList = getOnbeatVLQs(duet)
     for vlq in vlqOnbeatList:
-        if isParallelUnison(vlq):
-            error = ('Forbidden parallel motion to unison from bar '
-                     + str(vlq.v1n1.measureNumber) + ' to bar '
-                     + str(vlq.v1n2.measureNumber) + '.')
-            vlErrors.append(error)
+        parallel = getParallelInterval(vlq)
+        if parallel is None:
+            continue
+        if parallel == 'P1':
+            addError(context, 'parallelToUnisonFromBar',
+                     vlq.v1n1.measureNumber,
+                     vlq.v1n2.measureNumber)
         # TODO Revise for three parts, Westergaard p. 143.
         # Requires looking at simultaneous VLQs in a pair of verticalities.
-        if isParallelOctave(vlq):
-            error = ('Forbidden parallel motion to octave from bar '
-                     + str(vlq.v1n1.measureNumber) + ' to bar '
-                     + str(vlq.v1n2.measureNumber) + '.')
-            vlErrors.append(error)
-        if isParallelFifth(vlq):
-            parDirection = interval.Interval(vlq.v1n1, vlq.v1n2).direction
-            if vlq.v1n1.getContextByClass('Part').species == 'second':
-                vSpeciesNote1 = vlq.v1n1
-                vSpeciesNote2 = vlq.v1n2
-                vCantusNote1 = vlq.v2n1
-                vSpeciesPartNum = vlq.v1n1.getContextByClass('Part').partNum
-            elif vlq.v2n1.getContextByClass('Part').species == 'second':
-                vSpeciesNote1 = vlq.v2n1
-                vSpeciesNote2 = vlq.v2n2
-                vCantusNote1 = vlq.v1n1
-                vSpeciesPartNum = vlq.v2n1.getContextByClass('Part').partNum
+        if parallel == 'P8':
+            addError(context, 'parallelToOctaveFromBar',
+                     vlq.v1n1.measureNumber,
+                     vlq.v1n2.measureNumber)
+        if parallel == 'P5':
+            (vSpeciesNote1, vSpeciesNote2,
+             vCantusNote1) = getSpeciesAndCantusNotes(vlq, 'second')
+            vSpeciesPartNum = vSpeciesNote1.vlData.part.partNum
             localNotes = [note for note in context.parts[vSpeciesPartNum].notes
                           if (vSpeciesNote1.index
                               < note.index
                               < vSpeciesNote2.index)]
-            # Test for step motion contrary to parallels.
-            rules1 = [vSpeciesNote2.consecutions.leftDirection
-                      != parDirection,
-                      vSpeciesNote2.consecutions.rightDirection
-                      != parDirection,
-                      vSpeciesNote2.consecutions.leftType == 'step',
-                      vSpeciesNote2.consecutions.leftType == 'step']
-            # test for appearance of note as consonance in first bar
-            # TODO figure out better way to test for consonance
-            rules2 = False
-            for note in localNotes:
-                if (note.pitch == vSpeciesNote2.pitch
-                        and isConsonanceAboveBass(vCantusNote1, note)):
-                    rules2 = True
-                    break
             # TODO verify that the logic of the rules evaluation is correct
-            if not (all(rules1) or rules2):
-                error = ('Forbidden parallel motion to pefect fifth from the '
-                         'downbeat of bar ' + str(vlq.v1n1.measureNumber)
-                         + ' to the downbeat of bar '
-                         + str(vlq.v1n2.measureNumber) + '.')
-                vlErrors.append(error)
+            if not isParallelMotionMitigated(vlq, vSpeciesNote2,
+                                             vCantusNote1, localNotes):
+                addError(context, 'parallelToFifthBetweenDownbeats',
+                         vlq.v1n1.measureNumber,
+                         vlq.v1n2.measureNumber)
 
 
 def checkThirdSpeciesForbiddenMotions(context, duet, VLQs):
@@ -805,182 +867,170 @@ def checkThirdSpeciesForbiddenMotions(context, duet, VLQs):
     """
     # TODO: Finish this script.
 
+    # Notes in the measures of the species line, with their indexes in
+    # the line, gathered as needed and shared by the checks below.
+    measureNotes = {}
+
+    def getBarNotesAndIndexes(partNum, measureNumber):
+        key = (partNum, measureNumber)
+        if key not in measureNotes:
+            notes = getMeasureNotes(context.parts[partNum], measureNumber)
+            measureNotes[key] = (notes, [n.index for n in notes])
+        return measureNotes[key]
+
     def checkMotionsOntoBeat():
         # Check motion across the barline.
         for vlq in VLQs:
             # Check motion across the barline, as in first and second species.
-            if vlq.v1n2.beat == 1.0 and vlq.v2n2.beat == 1.0:
+            if vlq.v1n2.vlData.beat == 1.0 and vlq.v2n2.vlData.beat == 1.0:
                 checkForbiddenMotionsOntoBeatWithoutSyncope(context, duet, vlq)
             else:
                 # Check motion within the bar.
                 if isVoiceCrossing(vlq):
                     # Strict rule when the bass is involved.
                     if duet.includesBass:
-                        error = ('Voice crossing in bar '
-                                 + str(vlq.v2n2.measureNumber) + '.')
-                        vlErrors.append(error)
+                        addError(context, 'voiceCrossingInBar',
+                                 vlq.v2n2.measureNumber)
                     else:
-                        alert = ('ALERT: Upper voices cross in bar '
-                                 + str(vlq.v2n2.measureNumber) + '.')
-                        vlErrors.append(alert)
+                        addError(context, 'upperVoicesCrossInBar',
+                                 vlq.v2n2.measureNumber)
 
     def checkMotionsBeatToBeat():
         # Check motion from beat to beat.
         for vlq in getOnbeatVLQs(duet):
-            if isParallelUnison(vlq):
-                error = ('Forbidden parallel motion to unison from bar '
-                         + str(vlq.v1n1.measureNumber) + ' to bar '
-                         + str(vlq.v1n2.measureNumber) + '.')
-                vlErrors.append(error)
-            if isParallelOctave(vlq) or isParallelFifth(vlq):
-                parDirection = interval.Interval(vlq.v1n1, vlq.v1n2).direction
-                if vlq.v1n1.getContextByClass('Part').species == 'third':
-                    vSpeciesNote1 = vlq.v1n1
-                    vSpeciesNote2 = vlq.v1n2
-                    vCantusNote1 = vlq.v2n1
-                    vSpeciesPartNum = vlq.v1n1.getContextByClass(
-                        'Part').partNum
-                elif vlq.v2n1.getContextByClass('Part').species == 'third':
-                    vSpeciesNote1 = vlq.v2n1
-                    vSpeciesNote2 = vlq.v2n2
-                    vCantusNote1 = vlq.v1n1
-                    vSpeciesPartNum = vlq.v2n1.getContextByClass(
-                        'Part').partNum
-                localSpeciesMeasure = context.parts[vSpeciesPartNum].measures(
-                    vCantusNote1.measureNumber, vCantusNote1.measureNumber)
-                localNotes = localSpeciesMeasure.getElementsByClass('Measure')[
-                    0].notes
-                localNotes = [note for note in localNotes
-                              if (vSpeciesNote1.index
-                                  < note.index
-                                  < vSpeciesNote2.index)]
-                # Test for step motion contrary to parallels.
-                rules1 = [vSpeciesNote2.consecutions.leftDirection
-                          != parDirection,
-                          vSpeciesNote2.consecutions.rightDirection
-                          != parDirection,
-                          vSpeciesNote2.consecutions.leftType == 'step',
-                          vSpeciesNote2.consecutions.leftType == 'step']
-                # Test for appearance of note as consonance in first bar.
-                # TODO Figure out better way to test for consonance.
-                rules2 = False
-                for note in localNotes:
-                    if (note.pitch == vSpeciesNote2.pitch
-                            and isConsonanceAboveBass(vCantusNote1, note)):
-                        rules2 = True
-                        break
+            parallel = getParallelInterval(vlq)
+            if parallel == 'P1':
+                addError(context, 'parallelToUnisonFromBar',
+                         vlq.v1n1.measureNumber,
+                         vlq.v1n2.measureNumber)
+            if parallel in ('P8', 'P5'):
+                (vSpeciesNote1, vSpeciesNote2,
+                 vCantusNote1) = getSpeciesAndCantusNotes(vlq, 'third')
+                vSpeciesPartNum = vSpeciesNote1.vlData.part.partNum
+                # Get the notes of the bar that lie between the two
+                # species notes.
+                barNotes, barIndexes = getBarNotesAndIndexes(
+                    vSpeciesPartNum, vCantusNote1.measureNumber)
+                localNotes = barNotes[
+                    bisect.bisect_right(barIndexes, vSpeciesNote1.index):
+                    bisect.bisect_left(barIndexes, vSpeciesNote2.index)]
                 # TODO Verify that the logic of the rules evaluation is correct.
-                if not (all(rules1) or rules2):
-                    error = ('Forbidden parallel motion from the downbeat '
-                             'of bar ' + str(vlq.v1n1.measureNumber) +
-                             ' to the downbeat of bar '
-                             + str(vlq.v1n2.measureNumber) + '.')
-                    vlErrors.append(error)
+                if not isParallelMotionMitigated(vlq, vSpeciesNote2,
+                                                 vCantusNote1, localNotes):
+                    addError(context, 'parallelBetweenDownbeats',
+                             vlq.v1n1.measureNumber,
+                             vlq.v1n2.measureNumber)
 
     def checkMotionsOffToOnBeat():
         # Check motions from off to next but not consecutive on beat.
         vlqNonconsecutivesList = getNonconsecutiveOffbeatToOnbeatVLQs(duet)
         for vlq in vlqNonconsecutivesList:
-            if isParallelUnison(vlq):
-                error = ('Forbidden parallel motion to unison from bar '
-                         + str(vlq.v1n1.measureNumber) + ' to bar '
-                         + str(vlq.v1n2.measureNumber) + '.')
-                vlErrors.append(error)
-            if isParallelOctave(vlq):
-                parDirection = interval.Interval(vlq.v1n1, vlq.v1n2).direction
-                if vlq.v1n1.getContextByClass('Part').species == 'third':
-                    # vSpeciesNote1 = vlq.v1n1
-                    vSpeciesNote2 = vlq.v1n2
-                    vCantusNote1 = vlq.v2n1
-                    vSpeciesPartNum = vlq.v1n1.getContextByClass(
-                        'Part').partNum
-                elif vlq.v2n1.getContextByClass('Part').species == 'third':
-                    # vSpeciesNote1 = vlq.v2n1
-                    vSpeciesNote2 = vlq.v2n2
-                    vCantusNote1 = vlq.v1n1
-                    vSpeciesPartNum = vlq.v2n1.getContextByClass(
-                        'Part').partNum
+            parallel = getParallelInterval(vlq)
+            if parallel == 'P1':
+                addError(context, 'parallelToUnisonFromBar',
+                         vlq.v1n1.measureNumber,
+                         vlq.v1n2.measureNumber)
+            if parallel == 'P8':
+                (vSpeciesNote1, vSpeciesNote2,
+                 vCantusNote1) = getSpeciesAndCantusNotes(vlq, 'third')
+                vSpeciesPartNum = vSpeciesNote1.vlData.part.partNum
                 # Make a list of notes in the species line that are
                 # simultaneous with the first cantus tone.
-                localSpeciesMeasure = context.parts[vSpeciesPartNum].measures(
-                    vCantusNote1.measureNumber, vCantusNote1.measureNumber)
-                localNotes = localSpeciesMeasure.getElementsByClass('Measure')[
-                    0].notes
-                localNotes = [note for note in localNotes]
-                # Test for step motion contrary to parallels.
-                rules1 = [vSpeciesNote2.consecutions.leftDirection
-                          != parDirection,
-                          vSpeciesNote2.consecutions.rightDirection
-                          != parDirection,
-                          vSpeciesNote2.consecutions.leftType == 'step',
-                          vSpeciesNote2.consecutions.leftType == 'step']
-                # Test for appearance of note as consonance in first bar.
-                # TODO Figure out better way to test for consonance.
-                rules2 = False
-                for note in localNotes:
-                    if (note.pitch == vSpeciesNote2.pitch and
-                            isConsonanceAboveBass(vCantusNote1, note)):
-                        rules2 = True
-                        break
-                if not (all(rules1) or rules2):
-                    error = ('Forbidden parallel octaves from an offbeat '
-                             'note in bar ' + str(vlq.v1n1.measureNumber)
-                             + ' to the downbeat of bar '
-                             + str(vlq.v1n2.measureNumber) + ".")
-                    vlErrors.append(error)
+                localNotes = getMeasureNotes(context.parts[vSpeciesPartNum],
+                                             vCantusNote1.measureNumber)
+                if not isParallelMotionMitigated(vlq, vSpeciesNote2,
+                                                 vCantusNote1, localNotes):
+                    addError(context, 'parallelOctavesFromOffbeat',
+                             vlq.v1n1.measureNumber,
+                             vlq.v1n2.measureNumber)
 
     checkMotionsOntoBeat()
     checkMotionsBeatToBeat()
     checkMotionsOffToOnBeat()
 
 
-def checkFourthSpeciesForbiddenMotions(context, duet, VLQs):
+def getSpeciesAndCantusNotes(vlq, species):
+    """
+    Input a VLQ and the species of one of its lines, and return the two
+    notes of that line and the first note of the other line.
+    """
+    if vlq.v1n1.vlData.part.species == species:
+        return vlq.v1n1, vlq.v1n2, vlq.v2n1
+    elif vlq.v2n1.vlData.part.species == species:
+        return vlq.v2n1, vlq.v2n2, vlq.v1n1
+
+
+def isParallelMotionMitigated(vlq, speciesNote2, cantusNote1, localNotes):
+    """
+    Input a VLQ with parallel motion between the downbeats of two bars,
+    the second note of the species line, the first note of the cantus,
+    and the notes of the species line to consider in the first bar.
+    Determine whether the parallels are mitigated, either by step motion
+    contrary to the parallels or by the appearance of the second species
+    note as a consonance in the first bar.
+    """
+    parDirection = vlq.hIntervals[0].direction
+    noteData = speciesNote2.vlData
+    # Test for step motion contrary to parallels.
+    if (noteData.leftType == 'step'
+            and noteData.leftDirection != parDirection
+            and noteData.rightDirection != parDirection):
+        return True
+    # Test for appearance of note as consonance in first bar.
+    # TODO Figure out better way to test for consonance.
+    return any(n.pitch == speciesNote2.pitch
+               and isConsonanceAboveBass(cantusNote1, n)
+               for n in localNotes)
+
+
+def checkFourthSpeciesForbiddenMotions(context, duet, VLQs, vPairs=None):
     """Check the forbidden forms of motion for a duet in fourth
     species. Mostly limited to looking for parallel unisons and octaves
     in consecutive meausures.
     Use :py:func:`forbiddenMotionsOntoBeatWithoutSyncope`
     to check motion across the
     barline whenever the syncopations are broken.
+    The vertical pairs of the duet may be supplied, if already known.
     """
     if duet.parts[0].species == 'fourth':
         speciesPart = 0
     elif duet.parts[1].species == 'fourth':
         speciesPart = 1
+    if vPairs is None:
+        vPairs = getVerticalPairs(duet)
     # gather the simultaneities by location
     vPairsOnbeat = []
-    vPairsOnbeatDict = {}
     vPairsOffbeat = []
     # get the lists of onbeat  and offbeat VPs
-    for vPair in getVerticalPairs(duet):
-        if vPair is not None:
-            # Evaluate offbeat intervals when one of the parts is the bass.
-            if vPair[speciesPart].beat == 1.0:
-                vPairsOnbeat.append(vPair)
-                vPairsOnbeatDict[vPair[speciesPart].measureNumber] = vPair
-            else:
-                vPairsOffbeat.append(vPair)
+    for vPair in vPairs:
+        # Evaluate offbeat intervals when one of the parts is the bass.
+        if vPair[speciesPart].vlData.beat == 1.0:
+            vPairsOnbeat.append(vPair)
+        else:
+            vPairsOffbeat.append(vPair)
+    vPairsOnbeatDict = {vPair[speciesPart].measureNumber: vPair
+                        for vPair in vPairsOnbeat}
     # make lists of VLQs for each
     vlqsOffbeat = makeVLQFromVPairList(vPairsOffbeat)
     vlqsOnbeat = makeVLQFromVPairList(vPairsOnbeat)
     # evaluate the offbeat VLQs
     for vlq in vlqsOffbeat:
-        if isParallelUnison(vlq):
-            error = ('Forbidden parallel motion to unison going into bar '
-                     + str(vlq.v2n2.measureNumber))
-            vlErrors.append(error)
-        if isParallelOctave(vlq):
+        parallel = getParallelInterval(vlq)
+        if parallel == 'P1':
+            addError(context, 'syncopatedParallelToUnison',
+                     vlq.v2n2.measureNumber)
+        if parallel == 'P8':
             thisBar = vlq.v1n2.measureNumber
             thisOnbeatPair = vPairsOnbeatDict[thisBar]
             if not isConsonanceAboveBass(thisOnbeatPair[0], thisOnbeatPair[1]):
-                error = ('Forbidden parallel motion to octave going into bar '
-                         + str(vlq.v2n2.measureNumber))
-                vlErrors.append(error)
+                addError(context, 'syncopatedParallelToOctave',
+                         vlq.v2n2.measureNumber)
     # evaluate the onbeat VLQs
-    for vlq in vlqsOnbeat:
-        if isParallelUnison(vlq):
-            error = ('Forbidden parallel motion to unison going into bar '
-                     + str(vlq.v2n2.measureNumber))
-            vlErrors.append(error)
+    onbeatParallels = [getParallelInterval(vlq) for vlq in vlqsOnbeat]
+    for vlq, parallel in zip(vlqsOnbeat, onbeatParallels):
+        if parallel == 'P1':
+            addError(context, 'syncopatedParallelToUnison',
+                     vlq.v2n2.measureNumber)
     # Check second-species motion across barlines,
     # looking at vlq with initial untied offbeat note.
     for vlq in VLQs:
@@ -988,119 +1038,107 @@ def checkFourthSpeciesForbiddenMotions(context, duet, VLQs):
             speciesNote = vlq.v1n1
         elif speciesPart == 1:
             speciesNote = vlq.v2n1
-        if speciesNote.tie is None and speciesNote.beat > 1.0:
+        if speciesNote.tie is None and speciesNote.vlData.beat > 1.0:
             checkForbiddenMotionsOntoBeatWithoutSyncope(context, duet, vlq)
     # check second-species motion across final barline
-    for vlq in vlqsOnbeat:
-        if (isParallelOctave(vlq)
+    for vlq, parallel in zip(vlqsOnbeat, onbeatParallels):
+        if (parallel == 'P8'
                 and vlq.v1n2.tie is None
                 and vlq.v2n2.tie is None):
-            error = ('Forbidden parallel motion to octave going into bar '
-                     + str(vlq.v2n2.measureNumber))
-            vlErrors.append(error)
+            addError(context, 'syncopatedParallelToOctave',
+                     vlq.v2n2.measureNumber)
 
 
 def checkFirstSpeciesNonconsecutiveParallels(context, duet):
     """Check for restrictions on nonconsecutive parallel unisons
     and octaves in first species."""
     vPairList = getVerticalPairs(duet)
-    vPairTriples = [[vPairList[i], vPairList[i + 1], vPairList[i + 2]] for i in
-                    range(len(vPairList) - 2)]
-    for vpt in vPairTriples:
-        if isUnison(vpt[0][0], vpt[0][1]) or isOctave(vpt[0][0], vpt[0][1]):
-            vlq1 = makeVLQfromVertPairs(vpt[0], vpt[2])
-            p_int = None
-            if isParallelUnison(vlq1):
-                p_int = 'unisons'
-            elif isParallelOctave(vlq1):
-                p_int = 'octaves'
-            if p_int:
-                vlq2 = makeVLQfromVertPairs(vpt[0], vpt[1])
-                if vlq2 is not None:
-                    if isDisplaced(vlq2):
-                        pass
-                    elif (vlq1.v1n2.csd.value % 7 == vpt[2][0].csd.value % 7
-                          or vlq1.v1n2.csd.value % 7 == vpt[2][
-                              1].csd.value % 7):
-                        pass
-                    else:
-                        bar1 = vpt[0][0].measureNumber
-                        bar2 = vpt[2][0].measureNumber
-                        error = (
-                            f'Non-consecutive parallel {p_int} in bars {bar1}'
-                            f' and {bar2}.')
-                        vlErrors.append(error)
+    # Walk through the vertical pairs three at a time.
+    for vp0, vp1, vp2 in zip(vPairList, vPairList[1:], vPairList[2:]):
+        if not (isUnison(vp0[0], vp0[1]) or isOctave(vp0[0], vp0[1])):
+            continue
+        vlq1 = makeVLQfromVertPairs(vp0, vp2)
+        if isParallelUnison(vlq1):
+            p_int = 'unisons'
+        elif isParallelOctave(vlq1):
+            p_int = 'octaves'
+        else:
+            continue
+        vlq2 = makeVLQfromVertPairs(vp0, vp1)
+        if vlq2 is None or isDisplaced(vlq2):
+            continue
+        degree = vlq1.v1n2.csd.value % 7
+        if (degree == vp2[0].csd.value % 7
+                or degree == vp2[1].csd.value % 7):
+            continue
+        addError(context, 'nonconsecutiveParallels', p_int,
+                 vp0[0].measureNumber, vp2[0].measureNumber)
 
 
-def checkSecondSpeciesNonconsecutiveUnisons(duet):
-    """Check for restrictions on nonconsecutive parallel unisons."""
-    vPairList = getVerticalPairs(duet)
+def checkSecondSpeciesNonconsecutiveParallels(context, duet, vPairs=None,
+                                               unisons=True, octaves=True):
+    """Check for restrictions on nonconsecutive parallel unisons
+    and octaves in a single pass through the vertical pairs of the duet.
+    The vertical pairs may be supplied, if already known.
+    Errors for unisons are reported before errors for octaves.
+    """
     if duet.parts[0].species == 'second':
         speciesPart = 0
     elif duet.parts[1].species == 'second':
         speciesPart = 1
     else:
         return
+    if vPairs is None:
+        vPairs = getVerticalPairs(duet)
     firstUnison = None
-    for vPair in vPairList:
-        if firstUnison:
-            if (interval.Interval(vPair[0], vPair[1]).name == 'P1'
-                    and vPair[speciesPart].beat == 1.5
-                    and vPair[speciesPart].measureNumber - 1
-                    == firstUnison[0]):
-                error = ('Offbeat unisons in bars '
-                         + str(firstUnison[0]) + ' and '
-                         + str(vPair[speciesPart].measureNumber))
-                vlErrors.append(error)
-        if vPair is not None:
-            if (interval.Interval(vPair[0], vPair[1]).name == 'P1'
-                    and vPair[speciesPart].beat > 1.0):
-                firstUnison = (vPair[speciesPart].measureNumber, vPair)
-
-
-def checkSecondSpeciesNonconsecutiveOctaves(duet):
-    """Check for restrictions on nonconsecutive parallel octaves."""
-    vPairList = getVerticalPairs(duet)
-    if duet.parts[0].species == 'second':
-        speciesPart = 0
-    elif duet.parts[1].species == 'second':
-        speciesPart = 1
-    else:
-        return
     firstOctave = None
-    for vPair in vPairList:
-        if firstOctave:
-            if (interval.Interval(vPair[0], vPair[1]).name == 'P8'
-                    and vPair[speciesPart].beat > 1.0
-                    and vPair[speciesPart].measureNumber - 1
-                    == firstOctave[0]):
-                if interval.Interval(firstOctave[1][speciesPart],
-                                     vPair[speciesPart]).isDiatonicStep:
-                    if (vPair[speciesPart].consecutions.leftDirection
-                            == firstOctave[1][
-                                speciesPart].consecutions.leftDirection):
-                        error = ('Offbeat octaves in bars ' + str(
-                            firstOctave[0])
-                                 + ' and '
-                                 + str(vPair[speciesPart].measureNumber))
-                        vlErrors.append(error)
-                elif interval.Interval(firstOctave[1][speciesPart],
-                                       vPair[speciesPart]).generic.isSkip:
-                    if (vPair[speciesPart].consecutions.leftDirection
-                            != firstOctave[1][
-                                speciesPart].consecutions.leftDirection
-                            or firstOctave[1][
-                                speciesPart].consecutions.rightInterval.isDiatonicStep):
-                        continue
+    octaveErrors = []
+    for vPair in vPairs:
+        speciesNote = vPair[speciesPart]
+        name = getIntervalNames(vPair[0], vPair[1]).name
+        if name == 'P1' and unisons:
+            if (firstUnison
+                    and speciesNote.vlData.beat == 1.5
+                    and speciesNote.measureNumber - 1 == firstUnison[0]):
+                addError(context, 'offbeatUnisons', firstUnison[0],
+                         speciesNote.measureNumber)
+            if speciesNote.vlData.beat > 1.0:
+                firstUnison = (speciesNote.measureNumber, vPair)
+        elif name == 'P8' and octaves:
+            permitted = False
+            if (firstOctave
+                    and speciesNote.vlData.beat > 1.0
+                    and speciesNote.measureNumber - 1 == firstOctave[0]):
+                firstSpeciesNote = firstOctave[1][speciesPart]
+                ivl = interval.Interval(firstSpeciesNote, speciesNote)
+                if ivl.isDiatonicStep:
+                    if (speciesNote.vlData.leftDirection
+                            == firstSpeciesNote.vlData.leftDirection):
+                        octaveErrors.append((firstOctave[0],
+                                             speciesNote.measureNumber))
+                elif ivl.generic.isSkip:
+                    if (speciesNote.vlData.leftDirection
+                            != firstSpeciesNote.vlData.leftDirection
+                            or firstSpeciesNote.consecutions.rightInterval
+                            .isDiatonicStep):
+                        permitted = True
                     else:
-                        error = ('Offbeat octaves in bars '
-                                 + str(firstOctave[0]) + ' and '
-                                 + str(vPair[speciesPart].measureNumber))
-                        vlErrors.append(error)
-        if vPair is not None:
-            if (interval.Interval(vPair[0], vPair[1]).name == 'P8'
-                    and vPair[speciesPart].beat == 1.5):
-                firstOctave = (vPair[speciesPart].measureNumber, vPair)
+                        octaveErrors.append((firstOctave[0],
+                                             speciesNote.measureNumber))
+            if not permitted and speciesNote.vlData.beat == 1.5:
+                firstOctave = (speciesNote.measureNumber, vPair)
+    for bars in octaveErrors:
+        addError(context, 'offbeatOctaves', *bars)
+
+
+def checkSecondSpeciesNonconsecutiveUnisons(context, duet):
+    """Check for restrictions on nonconsecutive parallel unisons."""
+    checkSecondSpeciesNonconsecutiveParallels(context, duet, octaves=False)
+
+
+def checkSecondSpeciesNonconsecutiveOctaves(context, duet):
+    """Check for restrictions on nonconsecutive parallel octaves."""
+    checkSecondSpeciesNonconsecutiveParallels(context, duet, unisons=False)
 
 
 def checkConsecutions(context):
@@ -1109,33 +1147,32 @@ def checkConsecutions(context):
     repetitions. If the line is in fourth species,
     confirm that the pitches of tied-over notes match and
     that there are no direct repetitions.
+
+    The consecutions depend only on the parts of the context, not on the
+    duet being checked, so the check runs only once per context.
     """
+    if getattr(context, 'consecutionsChecked', False):
+        return
+    context.consecutionsChecked = True
     for part in context.parts:
         if part.species in ['second', 'third']:
             for n in part.recurse().notes:
                 if n.consecutions.leftType == 'same':
-                    error = ('Direct repetition in bar '
-                             + str(n.measureNumber) + '.')
-                    vlErrors.append(error)
+                    addError(context, 'directRepetition', n.measureNumber)
         if part.species == 'fourth':
             for n in part.recurse().notes:
                 if n.tie:
                     if (n.tie.type == 'start'
                             and n.consecutions.rightType != 'same'):
-                        error = ('Pitch not tied across the barline '
-                                 'into bar ' + str(n.measureNumber + 1) + '.')
-                        vlErrors.append(error)
+                        addError(context, 'pitchNotTied', n.measureNumber + 1)
                     elif (n.tie.type == 'stop'
                           and n.consecutions.leftType != 'same'):
-                        error = ('Pitch not tied across the barline '
-                                 'into bar ' + str(n.measureNumber) + '.')
-                        vlErrors.append(error)
+                        addError(context, 'pitchNotTied', n.measureNumber)
                 # TODO allow breaking into second species
                 elif not n.tie:
                     if n.consecutions.rightType == 'same':
-                        error = ('Direct repetition around bar '
-                                 + str(n.measureNumber) + '.')
-                        vlErrors.append(error)
+                        addError(context, 'directRepetitionAroundBar',
+                                 n.measureNumber)
 
 
 def checkFourthLeapsInBass(context):
@@ -1145,14 +1182,19 @@ def checkFourthLeapsInBass(context):
     """
     # find all the consecutive fourths in the bass line
     bassFourthsList = getFourthLeapsInBassDict(context)
+    # Measures and notes of the upper parts, indexed by offset as needed.
+    measureIndexes = {}
+    bnPartNum = len(context.parts) - 1
+    bassPart = context.parts[bnPartNum]
+    if not hasattr(bassPart, 'noteOnsets'):
+        indexNoteOffsets(bassPart)
     for bassFourth in bassFourthsList:
         bn1 = bassFourth[0]
         bn2 = bassFourth[1]
-        bnPartNum = len(context.parts) - 1
         bn1Meas = bn1.measureNumber
         bn2Meas = bn2.measureNumber
-        bn1Start = context.parts[bnPartNum].flatten().notes[bn1.index].offset
-        bn2Start = context.parts[bnPartNum].flatten().notes[bn2.index].offset
+        bn1Start = bassPart.noteOnsets[bn1.index]
+        bn2Start = bassPart.noteOnsets[bn2.index]
         bn1End = bn1Start + bn1.quarterLength
         bn2End = bn2Start + bn2.quarterLength
         # Implication is true until proven otherwise.
@@ -1160,200 +1202,157 @@ def checkFourthLeapsInBass(context):
 
         # Leaps of a fourth within a measure.
         if bn1Meas == bn2Meas:
-            fourthBass = interval.getAbsoluteLowerNote(bn1, bn2)
-            for n in context.parts[bnPartNum].measure(bn1Meas).notes:
-                rules1 = [n != bn1,
-                          n != bn2,
-                          n == interval.getAbsoluteLowerNote(n, fourthBass),
-                          interval.Interval(n, fourthBass).semitones
-                          < interval.Interval('P8').semitones,
-                          isTriadicConsonance(n, bn1),
-                          isTriadicConsonance(n, bn2)]
-                if all(rules1):
+            fourthBassPs = min(bn1.pitch.ps, bn2.pitch.ps)
+            for n in getMeasureNotes(bassPart, bn1Meas):
+                # A note at or below the lower note of the fourth
+                # and within an octave of it.
+                if (n != bn1
+                        and n != bn2
+                        and 0 <= fourthBassPs - n.pitch.ps < 12
+                        and isTriadicConsonance(n, bn1)
+                        and isTriadicConsonance(n, bn2)):
                     impliedSixFour = False
                     break
 
         # Leaps of a fourth across the barline.
         elif bn1Meas == bn2Meas - 1:
+            bn1BarLength = getMeasure(bassPart, bn1Meas).quarterLength
             # Check upper parts for note that denies the implication.
-            for part in context.parts[0:bnPartNum]:
+            for partNum, part in enumerate(context.parts[0:bnPartNum]):
+                if partNum not in measureIndexes:
+                    measureIndexes[partNum] = indexMeasureNotes(part)
                 # Get the two bars in the context of the bass fourth.
-                bars = part.getElementsByOffset(
-                    offsetStart=bn1Start,
-                    offsetEnd=bn2End,
-                    includeEndBoundary=False,
-                    mustFinishInSpan=False,
-                    mustBeginInSpan=False,
-                    includeElementsThatEndAtStart=False,
-                    classList=None
-                )
-                # Make note list for each bar of the part, simultaneous
-                # with notes of the fourth.
+                bars = getMeasuresInSpan(measureIndexes[partNum],
+                                         bn1Start, bn2End)
+                # Make lists of (offset, note) pairs for each bar of the
+                # part, simultaneous with notes of the fourth.
                 barseg1 = []
                 barseg2 = []
-                for bar in bars:
+                for barOffset, bar in bars:
                     # bar notes 1
-                    barns1 = bar.getElementsByOffset(
-                        offsetStart=bn1Start - bar.offset,
-                        offsetEnd=bn1End - bar.offset,
-                        includeEndBoundary=False,
-                        mustFinishInSpan=False,
-                        mustBeginInSpan=False,
-                        includeElementsThatEndAtStart=False,
-                        classList='Note'
-                    )
-                    for n in barns1:
-                        barseg1.append(n)
+                    barseg1 += getNotesInSpan(bar, bn1Start - barOffset,
+                                              bn1End - barOffset)
                     # bar notes 2
-                    barns2 = bar.getElementsByOffset(
-                        offsetStart=bn2Start - bar.offset,
-                        offsetEnd=bn2End,
-                        includeEndBoundary=False,
-                        mustFinishInSpan=False,
-                        mustBeginInSpan=False,
-                        includeElementsThatEndAtStart=False,
-                        classList='Note'
-                    )
-                    for n in barns2:
-                        barseg2.append(n)
+                    barseg2 += getNotesInSpan(bar, bn2Start - barOffset,
+                                              bn2End)
 
-                for n in barseg1:
+                # Test each note for consonance with the bass only once.
+                consonant1 = [isConsonanceAboveBass(bn1, x)
+                              for xOffset, x in barseg1]
+                for i, (nOffset, n) in enumerate(barseg1):
                     # rules for all species
                     # locally consonant, step-class contiguity
-                    rules1 = [isConsonanceAboveBass(bn1, n),
-                              interval.Interval(bn2, n).simpleName
-                              in ['m2', 'M2', 'm7', 'M7']]
+                    if not (consonant1[i]
+                            and getIntervalNames(bn2, n).simpleName
+                            in stepClassNames):
+                        continue
+                    nEnd = nOffset + n.quarterLength
 
                     # rules for first species
                     if len(barseg1) == 1:
-                        if all(rules1):
-                            impliedSixFour = False
-                            break
+                        denied = True
 
                     # rules for second species
-                    elif len(barseg1) == 2 and not barseg1[0].tie:
+                    elif len(barseg1) == 2 and not barseg1[0][1].tie:
                         # first in bar, leapt to, or last in bar
                         # (hence contiguous with bn2)
-                        rules2 = [n.offset == 0.0,
-                                  n.consecutions.leftType == 'skip',
-                                  n.offset + n.quarterLength
-                                  == context.score.measure(
-                                      bn1Meas).quarterLength]
-                        if all(rules1) and any(rules2):
-                            impliedSixFour = False
-                            break
+                        denied = (nOffset == 0.0
+                                  or nEnd == bn1BarLength
+                                  or n.consecutions.leftType == 'skip')
 
                     # rules for third species
                     elif len(barseg1) > 2:
                         # first in bar or last in bar (hence
-                        # contiguous with bn2)
-                        rules3a = [n.offset == 0.0,
-                                   n.offset + n.quarterLength
-                                   == context.score.measure(
-                                       bn1Meas).quarterLength]
+                        # contiguous with bn2), or else
                         # not first or last in bar and no step follows
-                        stepfollows = [x for x in barseg1
-                                       if x.offset > n.offset
-                                       and isConsonanceAboveBass(bn1, x)
-                                       and isDiatonicStep(x, n)]
-                        rules3b = [n.offset > 0.0,
-                                   n.offset + n.quarterLength
-                                   < context.score.measure(
-                                       bn1Meas).quarterLength,
-                                   stepfollows == []]
-
-                        if all(rules1) and (any(rules3a) or all(rules3b)):
-                            impliedSixFour = False
-                            break
+                        denied = (nOffset == 0.0
+                                  or nEnd == bn1BarLength
+                                  or (nOffset > 0.0
+                                      and nEnd < bn1BarLength
+                                      and not any(
+                                          xOffset > nOffset
+                                          and consonant1[j]
+                                          and isDiatonicStep(x, n)
+                                          for j, (xOffset, x)
+                                          in enumerate(barseg1))))
 
                     # rules for fourth species
-                    elif len(barseg1) == 2 and barseg1[1].tie:
-                        # TODO verify that no additional rule is needed
-                        rules4 = []  # [n.tie.type == 'start']
-                        if all(rules1) and all(rules4):
-                            impliedSixFour = False
-                            break
+                    elif barseg1[1][1].tie:
+                        # TODO verify that no additional rule is needed,
+                        #   e.g. n.tie.type == 'start'
+                        denied = True
 
                     # if fourth species is broken
-                    elif len(barseg1) == 2 and not barseg1[1].tie:
+                    else:
                         # first in bar, leapt to, or last in bar
                         # (hence contiguous with bn2)
-                        rules2 = [n.offset == 0.0,
-                                  n.consecutions.leftType == 'skip',
-                                  n.offset + n.quarterLength
-                                  == context.score.measure(
-                                      bn1Meas).quarterLength]
-                        if all(rules1) and any(rules2):
-                            impliedSixFour = False
-                            break
-
-                for n in barseg2:
+                        denied = (nOffset == 0.0
+                                  or nEnd == bn1BarLength
+                                  or n.consecutions.leftType == 'skip')
+
+                    if denied:
+                        impliedSixFour = False
+                        break
+
+                if len(barseg2) > 2:
+                    consonant2 = [isConsonanceAboveBass(bn1, x)
+                                  for xOffset, x in barseg2]
+                for nOffset, n in barseg2:
                     # locally consonant, step-class contiguity
-                    rules1 = [isConsonanceAboveBass(bn2, n),
-                              interval.Interval(bn1, n).simpleName
-                              in ['m2', 'M2', 'm7', 'M7']]
+                    if not (isConsonanceAboveBass(bn2, n)
+                            and getIntervalNames(bn1, n).simpleName
+                            in stepClassNames):
+                        continue
 
                     # rules for first species
                     if len(barseg2) == 1:
-                        if all(rules1):
-                            impliedSixFour = False
-                            break
+                        denied = True
 
                     # rules for second species
-                    elif len(barseg2) == 2 and not barseg2[0].tie:
-                        rules2 = [n.offset == 0.0,
-                                  n.consecutions.leftType == 'skip']
-                        if all(rules1) and any(rules2):
-                            impliedSixFour = False
-                            break
+                    elif len(barseg2) == 2 and not barseg2[0][1].tie:
+                        denied = (nOffset == 0.0
+                                  or n.consecutions.leftType == 'skip')
 
                     # rules for third species
                     elif len(barseg2) > 2:
                         # first in bar or not preceded by cons a step away
-                        stepprecedes = [x for x in barseg2
-                                        if x.offset < n.offset
-                                        and isConsonanceAboveBass(bn1, x)
-                                        and isDiatonicStep(x, n)]
-                        rules3 = [n.offset == 0.0,
-                                  stepprecedes == []]
-                        if all(rules1) and any(rules3):
-                            impliedSixFour = False
-                            break
+                        denied = (nOffset == 0.0
+                                  or not any(
+                                      xOffset < nOffset
+                                      and consonant2[j]
+                                      and isDiatonicStep(x, n)
+                                      for j, (xOffset, x)
+                                      in enumerate(barseg2)))
 
                     # rules for fourth species
-                    elif len(barseg2) == 2 and barseg2[0].tie:
-                        # TODO verify that no additional rule is needed
-                        rules4 = []  # [n.tie.type == 'start']
-                        if all(rules1) and all(rules4):
-                            impliedSixFour = False
-                            break
+                    else:
+                        # TODO verify that no additional rule is needed,
+                        #   e.g. n.tie.type == 'start'
+                        denied = True
+
+                    if denied:
+                        impliedSixFour = False
+                        break
 
             # Check third species bass part for note that
             # denies the implication.
-            if context.parts[bnPartNum].species == 'third':
-                bn1Measure = bn1.measureNumber
-                # Get the notes in the bar of the first bass note.
-                bassnotes = context.parts[bnPartNum].flatten().notes
-                barns1 = [n for n in bassnotes
-                          if n.measureNumber == bn1Measure]
+            if bassPart.species == 'third':
+                # Get the notes in the bar of the first bass note,
+                # from the measure index, with their offsets in the part.
+                barns1 = [(bassPart.noteOnsets[n.index], n)
+                          for n in getMeasureNotes(bassPart, bn1Meas)]
 
                 # TODO Finish this test.
-                for n in barns1:
-                    rules3a = [isDiatonicStep(n, bn2)]
-                    rules3b = [n.offset == 0.0,
-                               n == barns1[-2]]
-                    if all(rules3a) and any(rules3b):
+                for nOffset, n in barns1:
+                    if (isDiatonicStep(n, bn2)
+                            and (nOffset == 0.0 or n == barns1[-2][1])):
                         impliedSixFour = False
                         break
 
         if impliedSixFour and bn1Meas == bn2Meas:
-            error = ('Prohibited leap of a fourth in bar '
-                     + str(bn1Meas) + '.')
-            vlErrors.append(error)
+            addError(context, 'fourthLeapInBar', bn1Meas)
         elif impliedSixFour and bn1Meas != bn2Meas:
-            error = ('Prohibited leap of a fourth in bars '
-                     + str(bn1Meas) + '-' + str(bn2Meas) + '.')
-            vlErrors.append(error)
+            addError(context, 'fourthLeapAcrossBars', bn1Meas, bn2Meas)
 
 
 def checkFirstSpeciesSonority(context, duet):
@@ -1362,44 +1361,49 @@ def checkFirstSpeciesSonority(context, duet):
     fifthsAndOctaves = []
     unisons = []
     compounds = []
-    for ivl in onBeatIvls:
-        if ivl.simpleName in ['m3', 'M3', 'm6', 'M6']:
+    lastIndex = len(onBeatIvls) - 1
+    # Read the names of each interval once, in a single pass.
+    for i, ivl in enumerate(onBeatIvls):
+        name = ivl.name
+        semiSimpleName = ivl.semiSimpleName
+        if ivl.simpleName in imperfectConsonanceNames:
             imperfectIvls.append(ivl)
-        if ivl.semiSimpleName != ivl.name:
+        if semiSimpleName != name:
             compounds.append(ivl)
-    for ivl in onBeatIvls[1:-1]:
-        if ivl.semiSimpleName in ['P5', 'P8']:
-            fifthsAndOctaves.append(ivl)
-        if ivl.name in ['P1']:
-            unisons.append(ivl)
+        # only nonterminal intervals count as fifths, octaves, and unisons
+        if 0 < i < lastIndex:
+            if semiSimpleName in {'P5', 'P8'}:
+                fifthsAndOctaves.append(ivl)
+            if name == 'P1':
+                unisons.append(ivl)
     imperfectScore = len(imperfectIvls) / len(onBeatIvls)
     # count the number of imperfect intervals simpleName in [m3, M3, m6, M6]
     if imperfectScore < 0.6:
         advice = (f'* Use more imperfect intervals.' )
-        vlAdvice.append(advice)
+        context.vlAdvice.append(advice)
     # count the number of nonterminal fifths and octaves and
     if fifthsAndOctaves:
         advice = (f'* There is a least one perfect fifth or octave in the '
                   f'\n\tmiddle of the composition. Ensure that the emphasis '
                   f'\n\tprovided by this interval helps to stress a '
                   f'\n\tpitch that belongs to the background structure.')
-        vlAdvice.append(advice)
+        context.vlAdvice.append(advice)
     # identify the location of any nonfinal unisons and advise to reconsider
     if unisons:
         advice = (f'* There is at least one unison in the middle of the '
                   f'\n\tcomposition. Consider finding a solution that avoids '
                   f'\n\tunisons except in the first and last measures.')
-        vlAdvice.append(advice)
+        context.vlAdvice.append(advice)
     # count the number of nonsimple intervals and give advice
     compoundScore = len(compounds) / len(onBeatIvls)
     if 0.9 >= compoundScore > 0.5:
         advice = (f'* There are many compound intervals. Avoid intervals '
                   f'\n\tlarger than a tenth.')
-        vlAdvice.append(advice)
+        context.vlAdvice.append(advice)
     elif compoundScore > 0.9:
         advice = (f'* Almost all sonorities are compound intervals. Rewrite'
                   f'\n\tso that most intervals are not larger than a tenth.')
-        vlAdvice.append(advice)
+        context.vlAdvice.append(advice)
 
 
 def checkThreePartOnbeatSonority(context):
@@ -1416,13 +1420,15 @@ def getAllPartNumPairs(score):
     """
     Assemble a list of the pairwise combinations of parts in a score.
     Adopted from music21's theory analyzer
+    The combinations depend only on the number of parts, so they are
+    looked up in a table keyed on that number.
     """
-    partNumPairs = []
     numParts = len(score.parts)
-    for partNum1 in range(numParts - 1):
-        for partNum2 in range(partNum1 + 1, numParts):
-            partNumPairs.append((partNum1, partNum2))
-    return partNumPairs
+    partNumPairs = partNumPairsCache.get(numParts)
+    if partNumPairs is None:
+        partNumPairs = tuple(itertools.combinations(range(numParts), 2))
+        partNumPairsCache[numParts] = partNumPairs
+    return list(partNumPairs)
 
 
 def getOffsetList(score):
@@ -1430,23 +1436,25 @@ def getOffsetList(score):
     Get a list of note/rest offsets for all event initiations in a score.
     Accepts a stream as input: duet, context.score
     Use as input to building the context dictionary of verticals
+    The list is stored on the stream, so that the timespans of the
+    stream are made only once.
     """
-    tsTree = score.asTimespans(classList=(note.Note,note.Rest))
-    offsetList = [os for os in tsTree.allOffsets()]
-    return offsetList
+    if not hasattr(score, 'eventOffsets'):
+        tsTree = score.asTimespans(classList=(note.Note,note.Rest))
+        score.eventOffsets = [os for os in tsTree.allOffsets()]
+    return list(score.eventOffsets)
 
 
 def getOnbeatOffsetList(score):
     """
     Get a list of offsets for all downbeats in a score.
     Accepts a stream as input: duet, context.score.
+    The list is stored on the stream.
     """
-    measureOffsetsDict = score.measureOffsetMap()
-    downbeatOffsetList = []
-    for offset in measureOffsetsDict:
-        downbeatOffsetList.append(offset)
-    # Get the start/stop offsets for each measure.
-    return downbeatOffsetList
+    if not hasattr(score, 'downbeatOffsets'):
+        # Get the start offsets of the measures.
+        score.downbeatOffsets = list(score.measureOffsetMap())
+    return list(score.downbeatOffsets)
 
 
 def getOffbeatOffsetList(score):
@@ -1455,56 +1463,83 @@ def getOffbeatOffsetList(score):
     Accepts a stream as input: duet, context.score.
     """
     offsetList = getOffsetList(score)
-    downbeatOffsetList = getOnbeatOffsetList(score)
-    offbeatOffsetList = [offset for offset in offsetList if offset not in downbeatOffsetList]
+    downbeatOffsets = set(getOnbeatOffsetList(score))
+    offbeatOffsetList = [offset for offset in offsetList
+                         if offset not in downbeatOffsets]
     return offbeatOffsetList
 
 
+def getOnbeatAndOffbeatIntervals(duet):
+    """
+    Extract, in one pass over the vertical pairs of the duet, ordered
+    lists of the onbeat intervals and of the offbeat intervals.
+    The lists are stored on the duet.
+    """
+    if hasattr(duet, 'beatIntervals'):
+        return duet.beatIntervals
+    onbeatIntervals = []
+    offbeatIntervals = []
+    for vp in getVerticalPairs(duet):
+        upperStrength = getBeatStrength(vp[0])
+        lowerStrength = getBeatStrength(vp[1])
+        if upperStrength == 1.0 and lowerStrength == 1.0:
+            onbeatIntervals.append(interval.Interval(vp[1], vp[0]))
+        elif upperStrength > 1.0 or lowerStrength > 1.0:
+            offbeatIntervals.append(interval.Interval(vp[1], vp[0]))
+    duet.beatIntervals = (onbeatIntervals, offbeatIntervals)
+    return duet.beatIntervals
+
+
 def getOnbeatIntervals(duet):
     """
     Extract an ordered list of onbeat intervals in the duet.
     """
-    vertPairs = getVerticalPairs(duet)
-    intervalList = []
-    # get interval of onbeat vertical pair
-    for vp in vertPairs:
-        if vp[0].beatStrength == 1.0 and vp[1].beatStrength == 1.0:
-            intervalList.append(interval.Interval(vp[1],vp[0]))
-    return intervalList
+    return list(getOnbeatAndOffbeatIntervals(duet)[0])
 
 
 def getOffbeatIntervals(duet):
     """
     Extract an ordered list of offbeat intervals in the duet.
     """
-    vertPairs = getVerticalPairs(duet)
-    intervalList = []
-    # get interval of offbeat vertical pair
-    for vp in vertPairs:
-        if vp[0].beatStrength > 1.0 or vp[1].beatStrength > 1.0:
-            intervalList.append(interval.Interval(vp[1],vp[0]))
-    return intervalList
+    return list(getOnbeatAndOffbeatIntervals(duet)[1])
 
 
 # TODO needs a lot of work
 def getGenericKlangs(score):
     """Extract a list of generic intervals above the bass for a score with
     any number of parts"""
-    contentDicts = getAllVerticalContentDictionaries(score)
+    contentDicts = getVerticalContentDictionariesList(score)
     upperParts = range(0, (len(score.parts)-1))
     bassPartNum = score.parts[-1].partNum
     klangList = []
     for offset in contentDicts:
         contentDict = contentDicts[offset]
+        nBass = contentDict[bassPartNum]
         intervals = []
         for partNum in upperParts:
             nUpper = contentDict[partNum]
-            nBass = contentDict[bassPartNum]
-            intervals.append(interval.Interval(nBass, nUpper).generic.semiSimpleUndirected)
+            if nBass.isNote and nUpper.isNote:
+                intervals.append(getGenericSemiSimpleUndirected(nBass,
+                                                                nUpper))
+            else:
+                intervals.append(None)
         klangList.append(intervals)
     return klangList
 
 
+def getGenericSemiSimpleUndirected(n1, n2):
+    """
+    Input two notes with pitch and return the undirected generic interval
+    between them, reduced to a number from 1 to 8, as with
+    interval.Interval(n1, n2).generic.semiSimpleUndirected, but without
+    making the interval.
+    """
+    generic = abs(n2.pitch.diatonicNoteNum - n1.pitch.diatonicNoteNum) + 1
+    if generic <= 8:
+        return generic
+    return (generic - 2) % 7 + 2
+
+
 def getVerticalityContentDictFromDuet(duet, offset):
     """
     Assume that the parts in a duet contain a single note or rest each
@@ -1516,12 +1551,9 @@ def getVerticalityContentDictFromDuet(duet, offset):
     partCount = 2
     partNum = 0
     while partNum < partCount:
-        partNotes = [el for el in
-                     duet.parts[
-                         partNum].flatten().getElementsByOffset(
-                         offset, mustBeginInSpan=False, classList=[note.Note, note.Rest])]
         # assume that there's just one note or rest to a part here
-        contentDict[partNum] = partNotes[0]
+        contentDict[partNum] = getNoteOrRestAtOffset(duet.parts[partNum],
+                                                     offset)
         partNum += 1
     return contentDict
 
@@ -1562,13 +1594,19 @@ def getVerticalPairs(duet):
     """
     Generate an offset list for the duet and then construct a list of all
     the simultaneities (vertical pairs of notes) occurring
-    between the parts of the duet.
+    between the parts of the duet.  The list is stored on the duet.
     """
+    if hasattr(duet, 'verticalPairs'):
+        return list(duet.verticalPairs)
     vPairList = []
     offsetList = getOffsetList(duet)
     for offset in offsetList:
-        nUpper = getVerticalityContentDictFromDuet(duet, offset)[0]
-        nLower = getVerticalityContentDictFromDuet(duet, offset)[1]
+        # As in getVerticalPairsAndVLQs, look up the fractions used by
+        # the streams, so that the lookup is exact for tuplets.
+        contentDict = getVerticalityContentDictFromDuet(
+            duet, common.opFrac(offset))
+        nUpper = contentDict[0]
+        nLower = contentDict[1]
         if nUpper is None or nLower is None:
             vPair = None
         elif not nUpper.isNote or not nLower.isNote:
@@ -1577,7 +1615,8 @@ def getVerticalPairs(duet):
             vPair = (nUpper, nLower)
         if vPair:
             vPairList.append(vPair)
-    return vPairList
+    duet.verticalPairs = vPairList
+    return list(vPairList)
 
 
 def getAllVLQsFromDuet(duet):
@@ -1594,28 +1633,381 @@ def getAllVLQsFromDuet(duet):
     # get offsets of verticals
     offsetList = getOffsetList(duet)
     # make VLQs
-    for i in range(len(offsetList) - 1):
-        # get the pitches and offsets of the verticalities
-        # at index i and the following one
-        os1 = offsetList[i]
-        os2 = offsetList[i+1]
+    for os1, os2 in zip(offsetList, offsetList[1:]):
+        # get the notes or rests of the verticalities
+        # at one offset and the following one
+        v1n1 = getNoteOrRestAtOrBefore(part1, os1)
+        v1n2 = getNoteOrRestAtOrBefore(part1, os2)
+        v2n1 = getNoteOrRestAtOrBefore(part2, os1)
+        v2n2 = getNoteOrRestAtOrBefore(part2, os2)
         # check that there are no rests before making the VLQ
-        if (part1.flatten().getElementAtOrBefore(os1, classList=[note.Note, note.Rest]).isNote and
-                part1.flatten().getElementAtOrBefore(
-                    os2, classList=[note.Note, note.Rest]).isNote and
-                part2.flatten().getElementAtOrBefore(
-                    os1, classList=[note.Note, note.Rest]).isNote and
-                part2.flatten().getElementAtOrBefore(
-                    os2, classList=[note.Note, note.Rest]).isNote):
-            v1n1 = part1.flatten().getElementAtOrBefore(os1, classList=[note.Note])
-            v1n2 = part1.flatten().getElementAtOrBefore(os2, classList=[note.Note])
-            v2n1 = part2.flatten().getElementAtOrBefore(os1, classList=[note.Note])
-            v2n2 = part2.flatten().getElementAtOrBefore(os2, classList=[note.Note])
+        if v1n1.isNote and v1n2.isNote and v2n1.isNote and v2n2.isNote:
             a = voiceLeading.VoiceLeadingQuartet(v1n1, v1n2, v2n1, v2n2)
             allVLQs.append(a)
     return allVLQs
 
 
+def getVerticalPairsAndVLQs(duet, offsetList=None):
+    """
+    Construct in one pass over the offsets of the duet both the list of
+    vertical pairs, as in :py:func:`getVerticalPairs`, and the list of
+    voice-leading quartets, as in :py:func:`getAllVLQsFromDuet`.
+    The content of each verticality is looked up only once.
+    The offset list of the duet may be supplied, if already known.
+    The vertical pairs are stored on the duet for
+    :py:func:`getVerticalPairs`.
+    """
+    if offsetList is None:
+        offsetList = getOffsetList(duet)
+    vPairList = []
+    allVLQs = []
+    previousPair = None
+    for offset in offsetList:
+        # The timespan offsets are floats; restore the fractions used
+        # by the streams, so that the lookup is exact for tuplets.
+        contentDict = getVerticalityContentDictFromDuet(
+            duet, common.opFrac(offset))
+        nUpper = contentDict[0]
+        nLower = contentDict[1]
+        if (nUpper is not None and nLower is not None
+                and nUpper.isNote and nLower.isNote):
+            vPair = (nUpper, nLower)
+            vPairList.append(vPair)
+            if previousPair:
+                allVLQs.append(voiceLeading.VoiceLeadingQuartet(
+                    previousPair[0], nUpper, previousPair[1], nLower))
+        else:
+            vPair = None
+        previousPair = vPair
+    if not hasattr(duet, 'verticalPairs'):
+        duet.verticalPairs = list(vPairList)
+    return vPairList, allVLQs
+
+
+class NoteData:
+    """
+    The part, metrical position, and melodic consecutions of a note,
+    looked up once and stored on the note as note.vlData.  Reading the beat or
+    beat strength of a note in music21 requires a search for the
+    measure and time signature, and reading the type or direction of a
+    consecution requires the construction of an interval, so the rule
+    checks read the stored values instead.  The class uses slots, since
+    one object is made for every note in the context.
+    """
+    __slots__ = ('part', 'beat', 'beatStrength', 'leftType', 'rightType',
+                 'leftDirection', 'rightDirection', 'motionCode')
+
+    def __init__(self, note, part=None):
+        if part is None:
+            part = note.getContextByClass('Part')
+        self.part = part
+        self.beat = note.beat
+        self.beatStrength = note.beatStrength
+        self.leftType = note.consecutions.leftType
+        self.rightType = note.consecutions.rightType
+        self.leftDirection = note.consecutions.leftDirection
+        self.rightDirection = note.consecutions.rightDirection
+        self.motionCode = getMotionCode(note)
+
+
+def primeNoteData(context):
+    """
+    Attach a :py:class:`NoteData` object to each note in the parts of the
+    context that does not yet have one, and index the note offsets and
+    measures of each part for :py:func:`getNoteAtOffset`,
+    :py:func:`getMeasureNotes`, and :py:func:`getFirstNoteInMeasure`.
+    """
+    for part in context.parts:
+        if getattr(part, 'noteDataPrimed', False):
+            continue
+        for n in part.recurse().notes:
+            n.vlData = NoteData(n, part)
+        indexNoteOffsets(part)
+        indexMeasuresByNumber(part)
+        part.noteDataPrimed = True
+
+
+def indexNoteOffsets(part):
+    """
+    Store on a part the list of its notes together with their sorted
+    onset and release offsets.
+    """
+    part.flatNotes = []
+    part.noteOnsets = []
+    part.noteReleases = []
+    for n in part.flatten().notes:
+        part.flatNotes.append(n)
+        part.noteOnsets.append(n.offset)
+        part.noteReleases.append(common.opFrac(n.offset + n.quarterLength))
+
+
+def indexMeasuresByNumber(part):
+    """
+    Store on a part dictionaries of its measures, of the notes in each
+    measure, and of the first note in each measure, by measure number.
+    As with part.measure(), the first measure with a given number wins.
+    """
+    part.measuresByNumber = {}
+    part.measureNotes = {}
+    part.measureFirstNotes = {}
+    for bar in part.getElementsByClass('Measure'):
+        if bar.number in part.measuresByNumber:
+            continue
+        part.measuresByNumber[bar.number] = bar
+        part.measureNotes[bar.number] = list(bar.notes)
+        barNotes = bar.getElementsByClass('Note')
+        if barNotes:
+            part.measureFirstNotes[bar.number] = barNotes[0]
+
+
+def getMeasure(part, measureNumber):
+    """
+    Return the measure of a part with the given number.
+    """
+    if not hasattr(part, 'measuresByNumber'):
+        indexMeasuresByNumber(part)
+    return part.measuresByNumber[measureNumber]
+
+
+def getMeasureNotes(part, measureNumber):
+    """
+    Return a list of the notes in the given measure of a part.
+    """
+    if not hasattr(part, 'measureNotes'):
+        indexMeasuresByNumber(part)
+    return part.measureNotes[measureNumber]
+
+
+def getFirstNoteInMeasure(part, measureNumber):
+    """
+    Return the first note in the given measure of a part.
+    """
+    if not hasattr(part, 'measureFirstNotes'):
+        indexMeasuresByNumber(part)
+    return part.measureFirstNotes[measureNumber]
+
+
+def indexMeasureNotes(part):
+    """
+    Make an index of the measures in a part for
+    :py:func:`getMeasuresInSpan` and :py:func:`getNotesInSpan`:
+    the sorted onsets and releases of the measures, and on each measure
+    the sorted onsets and releases of its notes, relative to the measure.
+    """
+    bars = list(part.getElementsByClass('Measure'))
+    onsets = []
+    releases = []
+    for bar in bars:
+        onsets.append(bar.offset)
+        releases.append(common.opFrac(bar.offset + bar.quarterLength))
+        bar.flatNotes = []
+        bar.noteOnsets = []
+        bar.noteReleases = []
+        for n in bar.notes:
+            bar.flatNotes.append(n)
+            bar.noteOnsets.append(n.offset)
+            bar.noteReleases.append(
+                common.opFrac(n.offset + n.quarterLength))
+    return bars, onsets, releases
+
+
+def getMeasuresInSpan(measureIndex, offsetStart, offsetEnd):
+    """
+    Return a list of (offset, measure) pairs for the measures of an index
+    made by :py:func:`indexMeasureNotes` that sound during the span from
+    offsetStart up to offsetEnd.
+    """
+    bars, onsets, releases = measureIndex
+    first = bisect.bisect_right(releases, offsetStart)
+    last = bisect.bisect_left(onsets, offsetEnd)
+    return [(onsets[i], bars[i]) for i in range(first, last)]
+
+
+def getNotesInSpan(bar, offsetStart, offsetEnd):
+    """
+    Return a list of (offset, note) pairs for the notes of an indexed
+    measure that sound during the span from offsetStart up to offsetEnd,
+    where the offsets are relative to the measure.
+    """
+    first = bisect.bisect_right(bar.noteReleases, offsetStart)
+    last = bisect.bisect_left(bar.noteOnsets, offsetEnd)
+    return [(bar.noteOnsets[i], bar.flatNotes[i])
+            for i in range(first, last)]
+
+
+def indexNotesAndRests(part):
+    """
+    Store on a part the list of its notes and rests together with their
+    sorted onset and release offsets.
+    """
+    part.flatNotesAndRests = []
+    part.noteAndRestOnsets = []
+    part.noteAndRestReleases = []
+    for n in part.flatten().notesAndRests:
+        part.flatNotesAndRests.append(n)
+        part.noteAndRestOnsets.append(n.offset)
+        part.noteAndRestReleases.append(
+            common.opFrac(n.offset + n.quarterLength))
+
+
+def getNoteOrRestAtOrBefore(part, offset):
+    """
+    Return the last note or rest of a part that begins at or before the
+    given offset, or None, as with getElementAtOrBefore() on the flattened
+    part.  Uses a binary search of the onsets stored by
+    :py:func:`indexNotesAndRests`.
+    """
+    if not hasattr(part, 'noteAndRestOnsets'):
+        indexNotesAndRests(part)
+    i = bisect.bisect_right(part.noteAndRestOnsets, common.opFrac(offset))
+    if i == 0:
+        return None
+    return part.flatNotesAndRests[i - 1]
+
+
+def getNoteOrRestAtOffset(part, offset):
+    """
+    Return the note or rest of a part that sounds at the given offset,
+    or None if the part has ended.  Uses a binary search of the onsets
+    stored by :py:func:`indexNotesAndRests`.
+    """
+    if not hasattr(part, 'noteAndRestOnsets'):
+        indexNotesAndRests(part)
+    offset = common.opFrac(offset)
+    i = bisect.bisect_right(part.noteAndRestOnsets, offset) - 1
+    if i >= 0 and offset < part.noteAndRestReleases[i]:
+        return part.flatNotesAndRests[i]
+    return None
+
+
+def getNoteAtOrBefore(part, offset):
+    """
+    Return the last note of a part that begins at or before the
+    given offset, or None.  Uses a binary search of the onsets stored by
+    :py:func:`indexNoteOffsets`.
+    """
+    if not hasattr(part, 'noteOnsets'):
+        indexNoteOffsets(part)
+    i = bisect.bisect_right(part.noteOnsets, common.opFrac(offset))
+    if i == 0:
+        return None
+    return part.flatNotes[i - 1]
+
+
+def getBeat(n):
+    """
+    Return the beat of a note, read from its stored note data if any.
+    """
+    if hasattr(n, 'vlData'):
+        return n.vlData.beat
+    return n.beat
+
+
+def getBeatStrength(n):
+    """
+    Return the beat strength of a note, read from its stored note data
+    if any.
+    """
+    if hasattr(n, 'vlData'):
+        return n.vlData.beatStrength
+    return n.beatStrength
+
+
+def getNoteAtOffset(part, offset):
+    """
+    Return the note of a part that sounds at the given offset,
+    or None if no note sounds there.  Uses a binary search of the
+    onsets stored by :py:func:`indexNoteOffsets`.
+    """
+    if not hasattr(part, 'noteOnsets'):
+        indexNoteOffsets(part)
+    offset = common.opFrac(offset)
+    i = bisect.bisect_right(part.noteOnsets, offset) - 1
+    if i >= 0 and offset < part.noteReleases[i]:
+        return part.flatNotes[i]
+    return None
+
+
+class VLQTable:
+    """
+    A table of the note data that the rule checks read from each of the
+    voice-leading quartets in a duet.  The data is stored in aligned
+    lists (one entry per quartet), so that the rule checks can stream
+    over plain values instead of walking the music21 object graph of
+    every quartet again and again.  The table is built once per duet
+    and shared among the checks, together with the event offsets and
+    the vertical pairs of the duet.
+    """
+
+    def __init__(self, VLQs, vPairs=None, offsets=None):
+        self.VLQs = VLQs
+        self.vPairs = vPairs
+        self.offsets = offsets
+        # Measure numbers.
+        self.v1n1Measures = []
+        self.v1n2Measures = []
+        self.v2n1Measures = []
+        # Tie types of the notes in the first verticality.
+        self.v1n1TieTypes = []
+        self.v2n1TieTypes = []
+        # Whether one voice is stationary while the other moves in
+        # one direction.
+        self.movesOneWay = []
+        # Vertical intervals.
+        self.vSimpleNames1 = []
+        self.vSemiSimpleNames2 = []
+        self.vDissonant1 = []
+        self.vDissonant2 = []
+        self.vPermittedUpper1 = []
+        self.vPermittedUpper2 = []
+        for vlq in VLQs:
+            v1n1, v1n2, v2n1, v2n2 = vlq.v1n1, vlq.v1n2, vlq.v2n1, vlq.v2n2
+            self.v1n1Measures.append(v1n1.measureNumber)
+            self.v1n2Measures.append(v1n2.measureNumber)
+            self.v2n1Measures.append(v2n1.measureNumber)
+            self.v1n1TieTypes.append(v1n1.tie.type if v1n1.tie else None)
+            self.v2n1TieTypes.append(v2n1.tie.type if v2n1.tie else None)
+            v1Stationary = v1n1 == v1n2
+            v2Stationary = v2n1 == v2n2
+            self.movesOneWay.append(
+                (v1Stationary
+                 and v2n1.vlData.motionCode == v2n2.vlData.motionCode)
+                or (v2Stationary
+                    and v1n1.vlData.motionCode == v1n2.vlData.motionCode))
+            # Classify each vertical interval from its simple name,
+            # read once from the VLQ, as in isVerticalDissonance and
+            # isPermittedDissonanceBetweenUpper.
+            simpleName1 = vlq.vIntervals[0].simpleName
+            simpleName2 = vlq.vIntervals[1].simpleName
+            self.vSimpleNames1.append(simpleName1)
+            self.vSemiSimpleNames2.append(vlq.vIntervals[1].semiSimpleName)
+            self.vDissonant1.append(
+                simpleName1 not in verticalConsonanceNames)
+            self.vDissonant2.append(
+                simpleName2 not in verticalConsonanceNames)
+            self.vPermittedUpper1.append(
+                simpleName1 in permittedUpperDissonanceNames)
+            self.vPermittedUpper2.append(
+                simpleName2 in permittedUpperDissonanceNames)
+
+    def __len__(self):
+        return len(self.VLQs)
+
+
+def getMotionCode(note):
+    """
+    Encode the directions by which a note is approached and left as
+    a single integer, so that the motions of two notes can be compared
+    in one step.  Each direction is coded as -1, 0, or 1, or 2 if the
+    note is not approached or left.
+    """
+    left = note.consecutions.leftDirection
+    right = note.consecutions.rightDirection
+    left = 2 if left is None else int(left)
+    right = 2 if right is None else int(right)
+    return (left + 1) * 4 + (right + 1)
+
+
 def getOnbeatVLQs(duet):
     """
     Generate an offset list of downbeats in the duet, make a pairwise list
@@ -1629,22 +2021,15 @@ def getOnbeatVLQs(duet):
     # get onbeat offsets of verticals
     offsetList = getOnbeatOffsetList(duet)
     # make VLQs
-    for i in range(len(offsetList) - 1):
-        # get the pitches and offsets of the verticalities at index i and the following one
-        os1 = offsetList[i]
-        os2 = offsetList[i+1]
+    for os1, os2 in zip(offsetList, offsetList[1:]):
+        # get the notes or rests of the verticalities
+        # at one offset and the following one
+        v1n1 = getNoteOrRestAtOrBefore(part1, os1)
+        v1n2 = getNoteOrRestAtOrBefore(part1, os2)
+        v2n1 = getNoteOrRestAtOrBefore(part2, os1)
+        v2n2 = getNoteOrRestAtOrBefore(part2, os2)
         # check that there are no rests before making the VLQ
-        if (part1.flatten().getElementAtOrBefore(os1, classList=[note.Note, note.Rest]).isNote and
-                part1.flatten().getElementAtOrBefore(
-                    os2, classList=[note.Note, note.Rest]).isNote and
-                part2.flatten().getElementAtOrBefore(
-                    os1, classList=[note.Note, note.Rest]).isNote and
-                part2.flatten().getElementAtOrBefore(
-                    os2, classList=[note.Note, note.Rest]).isNote):
-            v1n1 = part1.flatten().getElementAtOrBefore(os1, classList=[note.Note])
-            v1n2 = part1.flatten().getElementAtOrBefore(os2, classList=[note.Note])
-            v2n1 = part2.flatten().getElementAtOrBefore(os1, classList=[note.Note])
-            v2n2 = part2.flatten().getElementAtOrBefore(os2, classList=[note.Note])
+        if v1n1.isNote and v1n2.isNote and v2n1.isNote and v2n2.isNote:
             a = voiceLeading.VoiceLeadingQuartet(v1n1, v1n2, v2n1, v2n2)
             allVLQs.append(a)
     return allVLQs
@@ -1663,6 +2048,18 @@ def getNonconsecutiveOffbeatToOnbeatVLQs(duet):
     part2 = duet.parts[1]
     # get offsets of verticals
     offsetList = getOffsetList(duet)
+    # For each vertical, find the index of the first vertical from there
+    # on in which the notes of both parts are on the beat, so that the
+    # look ahead is a single lookup.
+    nextOnbeat = [None] * (len(offsetList) + 1)
+    for k in range(len(offsetList) - 1, -1, -1):
+        n1 = getNoteAtOrBefore(part1, offsetList[k])
+        n2 = getNoteAtOrBefore(part2, offsetList[k])
+        if (n1 is not None and n2 is not None
+                and getBeat(n1) == 1.0 and getBeat(n2) == 1.0):
+            nextOnbeat[k] = k
+        else:
+            nextOnbeat[k] = nextOnbeat[k+1]
     # make VLQs
     for i in range(len(offsetList) - 1):
         # get the pitches and offsets of the verticalities at index i
@@ -1671,45 +2068,26 @@ def getNonconsecutiveOffbeatToOnbeatVLQs(duet):
         # if j is offbeat, look ahead to find next onbeat vert and make vlq
         os1 = offsetList[i]
         os2 = offsetList[i+1]
+        v1n1 = getNoteOrRestAtOrBefore(part1, os1)
+        v1n2 = getNoteOrRestAtOrBefore(part1, os2)
+        v2n1 = getNoteOrRestAtOrBefore(part2, os1)
+        v2n2 = getNoteOrRestAtOrBefore(part2, os2)
         # check that there are no rests before proceeding
-        if (part1.flatten().getElementAtOrBefore(os1, classList=[note.Note, note.Rest]).isNote and
-                part1.flatten().getElementAtOrBefore(
-                    os2, classList=[note.Note, note.Rest]).isNote and
-                part2.flatten().getElementAtOrBefore(
-                    os1, classList=[note.Note, note.Rest]).isNote and
-                part2.flatten().getElementAtOrBefore(
-                    os2, classList=[note.Note, note.Rest]).isNote):
-            if (part1.flatten().getElementAtOrBefore(os1).beat > 1.0 or
-                    part2.flatten().getElementAtOrBefore(
-                        os1, classList=[note.Note]).beat > 1.0):
-                if not (part1.flatten().getElementAtOrBefore(
-                        os2, classList=[note.Note]).beat == 1.0 and
-                        part2.flatten().getElementAtOrBefore(
-                            os2, classList=[note.Note]).beat == 1.0):
-                    nextOnbeat = False
-                    n = 2
-                    while nextOnbeat == False:
-                        os2 = offsetList[i+n]
-                        if (part1.flatten().getElementAtOrBefore(
-                                os2, classList=[note.Note]).beat == 1.0 and
-                                part2.flatten().getElementAtOrBefore(
-                                    os2, classList=[note.Note]).beat == 1.0):
-                            nextOnbeat = True
-                            v1n1 = part1.flatten().getElementAtOrBefore(
-                                os1, classList=[note.Note])
-                            v1n2 = part1.flatten().getElementAtOrBefore(
-                                os2, classList=[note.Note])
-                            v2n1 = part2.flatten().getElementAtOrBefore(
-                                os1, classList=[note.Note])
-                            v2n2 = part2.flatten().getElementAtOrBefore(
-                                os2, classList=[note.Note])
-                            a = voiceLeading.VoiceLeadingQuartet(v1n1, v1n2,
-                                                                 v2n1, v2n2)
-                            allVLQs.append(a)
-                        else:
-                            n += 1
-        else:
-            pass
+        if not (v1n1.isNote and v1n2.isNote
+                and v2n1.isNote and v2n2.isNote):
+            continue
+        if not (getBeat(v1n1) > 1.0 or getBeat(v2n1) > 1.0):
+            continue
+        if getBeat(v1n2) == 1.0 and getBeat(v2n2) == 1.0:
+            continue
+        # look ahead to the next vertical in which both notes are onbeat
+        k = nextOnbeat[i+2]
+        if k is None:
+            continue
+        v1n2 = getNoteAtOrBefore(part1, offsetList[k])
+        v2n2 = getNoteAtOrBefore(part2, offsetList[k])
+        a = voiceLeading.VoiceLeadingQuartet(v1n1, v1n2, v2n1, v2n2)
+        allVLQs.append(a)
 
     return allVLQs
 
@@ -1719,17 +2097,9 @@ def makeVLQFromVPairList(vPairList):
     Given a list of simultaneous note pairs, create a voice-leading
     quartet for each consecutive pair of pairs and return the list of VLQs.
     """
-    quartetList = []
-    for quartet in pairwise(vPairList):
-        quartetList.append((quartet[0][1], quartet[1][1],
-                            quartet[0][0], quartet[1][0]))
-    vlqList = []
-    for quartet in quartetList:
-        vlqList.append(voiceLeading.VoiceLeadingQuartet(quartet[0],
-                                                        quartet[1],
-                                                        quartet[2],
-                                                        quartet[3]))
-    return vlqList
+    return [voiceLeading.VoiceLeadingQuartet(pair1[1], pair2[1],
+                                             pair1[0], pair2[0])
+            for pair1, pair2 in pairwise(vPairList)]
 
 
 def makeVLQfromVertPairs(vpair1, vpair2):
@@ -1754,14 +2124,9 @@ def getFourthLeapsInBassDict(context):
     """
     Identify P4 intervals in the bass part and make a list of the note pairs.
     """
-    bassNotes = [note for note in context.parts[-1].flatten().notes]
-    bassPairs = pairwise(bassNotes)
-    bassFourthsList = []
-    for pair in bassPairs:
-        if interval.Interval(pair[0], pair[1]).name == "P4":
-            fourthNotes = [pair[0], pair[1]]
-            bassFourthsList.append(fourthNotes)
-    return bassFourthsList
+    bassNotes = context.parts[-1].flatten().notes
+    return [[n1, n2] for n1, n2 in pairwise(bassNotes)
+            if getIntervalNames(n1, n2).name == 'P4']
 
 
 # -----------------------------------------------------------------------------
@@ -1771,6 +2136,26 @@ def getFourthLeapsInBassDict(context):
 # Methods for note pairs
 
 
+def getIntervalNames(n1, n2):
+    """
+    Input two notes with pitch and return the name, simple name, and
+    semisimple name of the interval from the first to the second.
+    The names of an interval depend only on the diatonic and chromatic
+    distances between the pitches, so the names are looked up in a
+    table keyed on those distances, and a music21 Interval is made
+    only the first time a distance pair occurs.
+    """
+    p1 = n1.pitch
+    p2 = n2.pitch
+    key = (p2.diatonicNoteNum - p1.diatonicNoteNum, p2.ps - p1.ps)
+    names = intervalNameCache.get(key)
+    if names is None:
+        ivl = interval.Interval(n1, n2)
+        names = IntervalNames(ivl.name, ivl.simpleName, ivl.semiSimpleName)
+        intervalNameCache[key] = names
+    return names
+
+
 def isConsonanceAboveBass(b, u):
     """
     Input two notes with pitch, a bass note and an upper note, and
@@ -1780,12 +2165,15 @@ def isConsonanceAboveBass(b, u):
     'P1', 'm3', 'M3', 'P5', 'm6', 'M6'.
     Equivalent to music21.Interval.isConsonant().
     """
-    vert_int = interval.Interval(b, u)
-    if (interval.getAbsoluteLowerNote(b, u) == b and
-            vert_int.simpleName in {'P1', 'm3', 'M3', 'P5', 'm6', 'M6'}):
-        return True
-    else:
+    # The bass is the lower note unless the upper note is below it.
+    semitones = u.pitch.ps - b.pitch.ps
+    if semitones < 0:
+        return False
+    # Every consonance spans one of the consonant semitone classes, so
+    # look up the name only for intervals that do.
+    if semitones % 12 not in consonantSemitones:
         return False
+    return getIntervalNames(b, u).simpleName in consonanceAboveBassNames
 
 
 def isThirdOrSixthAboveBass(b, u):
@@ -1796,12 +2184,10 @@ def isThirdOrSixthAboveBass(b, u):
     equivalent of the actual interval is in the list:
     'm3', 'M3', 'm6', 'M6'.
     """
-    vert_int = interval.Interval(b, u)
-    if (interval.getAbsoluteLowerNote(b, u) == b and
-            vert_int.simpleName in {'m3', 'M3', 'm6', 'M6'}):
-        return True
-    else:
+    semitones = u.pitch.ps - b.pitch.ps
+    if semitones < 0 or semitones % 12 not in imperfectSemitones:
         return False
+    return getIntervalNames(b, u).simpleName in imperfectConsonanceNames
 
 
 def isConsonanceBetweenUpper(u1, u2):
@@ -1811,11 +2197,12 @@ def isConsonanceBetweenUpper(u1, u2):
     whether the simple interval equivalent of the actual interval is
     in the list: 'P1', 'm3', 'M3', 'P4', 'P5', 'm6', 'M6'.
     """
-    vert_int = interval.Interval(u1, u2)
-    if vert_int.simpleName in {'P1', 'm3', 'M3', 'P4', 'P5', 'm6', 'M6'}:
-        return True
-    else:
+    # Only intervals in the semitone classes of the triadic consonances
+    # can qualify.
+    if abs(u2.pitch.ps - u1.pitch.ps) % 12 not in triadicConsonantSemitones:
         return False
+    simpleName = getIntervalNames(u1, u2).simpleName
+    return simpleName in triadicConsonanceNames
 
 
 def isPermittedDissonanceBetweenUpper(u1, u2):
@@ -1827,11 +2214,8 @@ def isPermittedDissonanceBetweenUpper(u1, u2):
     Each note requires additional test with bass:
     :py:func:`isThirdOrSixthAboveBass`.
     """
-    vert_int = interval.Interval(u1, u2)
-    if vert_int.simpleName in {'P4', 'A4', 'd5'}:
-        return True
-    else:
-        return False
+    simpleName = getIntervalNames(u1, u2).simpleName
+    return simpleName in permittedUpperDissonanceNames
 
 
 def isTriadicConsonance(n1, n2):
@@ -1842,11 +2226,9 @@ def isTriadicConsonance(n1, n2):
     equivalent of the actual interval is in the list:
     'P1', 'm3', 'M3', 'P4', 'P5', 'm6', 'M6'.
     """
-    int = interval.Interval(n1, n2)
-    if int.simpleName in {'P1', 'm3', 'M3', 'P4', 'P5', 'm6', 'M6'}:
-        return True
-    else:
+    if abs(n2.pitch.ps - n1.pitch.ps) % 12 not in triadicConsonantSemitones:
         return False
+    return getIntervalNames(n1, n2).simpleName in triadicConsonanceNames
 
 
 def isTriadicInterval(n1, n2):
@@ -1858,12 +2240,7 @@ def isTriadicInterval(n1, n2):
     equivalent of the actual interval is in the list:
     'P1', 'm3', 'M3', 'P4', 'A4', 'd5', 'P5', 'm6', 'M6'.
     """
-    ivl = interval.Interval(n1, n2)
-    if ivl.simpleName in {'P1', 'm3', 'M3', 'P4',
-                          'A4', 'd5', 'P5', 'm6', 'M6'}:
-        return True
-    else:
-        return False
+    return getIntervalNames(n1, n2).simpleName in triadicIntervalNames
 
 
 def isPerfectVerticalConsonance(n1, n2):
@@ -1873,11 +2250,10 @@ def isPerfectVerticalConsonance(n1, n2):
     whether the simple interval equivalent of the actual interval
     is in the list: 'P1', 'P5', 'P8'.
     """
-    ivl = interval.Interval(n1, n2)
-    if ivl.simpleName in {'P1', 'P5', 'P8'}:
-        return True
-    else:
+    # Only intervals of 0 or 7 semitones, modulo the octave, can qualify.
+    if abs(n2.pitch.ps - n1.pitch.ps) % 12 not in perfectSemitones:
         return False
+    return getIntervalNames(n1, n2).simpleName in perfectConsonanceNames
 
 
 def isImperfectVerticalConsonance(n1, n2):
@@ -1889,11 +2265,11 @@ def isImperfectVerticalConsonance(n1, n2):
     interval is in the list:
     'm3', 'M3', 'm6', 'M6'.
     """
-    ivl = interval.Interval(n1, n2)
-    if ivl.simpleName in {'m3', 'M3', 'm6', 'M6'}:
-        return True
-    else:
+    # Only intervals of 3, 4, 8, or 9 semitones, modulo the octave,
+    # can qualify.
+    if abs(n2.pitch.ps - n1.pitch.ps) % 12 not in imperfectSemitones:
         return False
+    return getIntervalNames(n1, n2).simpleName in imperfectConsonanceNames
 
 
 def isVerticalDissonance(n1, n2):
@@ -1904,12 +2280,12 @@ def isVerticalDissonance(n1, n2):
     is not in the list:
     'P1', 'P5', 'P8', 'm3', 'M3', 'm6', 'M6'.
     """
-    ivl = interval.Interval(n1, n2)
-    if ivl.simpleName not in {'P1', 'P5', 'P8',
-                              'm3', 'M3', 'm6', 'M6'}:
+    # Intervals outside the semitone classes of the consonances are
+    # dissonant however they are spelled.
+    if abs(n2.pitch.ps - n1.pitch.ps) % 12 not in consonantSemitones:
         return True
-    else:
-        return False
+    simpleName = getIntervalNames(n1, n2).simpleName
+    return simpleName not in verticalConsonanceNames
 
 
 def isDiatonicStep(n1, n2):
@@ -1919,11 +2295,11 @@ def isDiatonicStep(n1, n2):
     the actual interval is in the list:
     'm2', 'M2'.
     """
-    lin_ivl = interval.Interval(n1, n2)
-    if lin_ivl.name in {'m2', 'M2'}:
-        return True
-    else:
-        return False
+    # A second (one diatonic step) spanning one or two semitones
+    # in the same direction.
+    diatonic = n2.pitch.diatonicNoteNum - n1.pitch.diatonicNoteNum
+    semitones = n2.pitch.ps - n1.pitch.ps
+    return abs(diatonic) == 1 and 1 <= semitones * diatonic <= 2
 
 
 def isUnison(n1, n2):
@@ -1933,11 +2309,8 @@ def isUnison(n1, n2):
     the actual interval is in the list:
     'P1'.
     """
-    lin_ivl = interval.Interval(n1, n2)
-    if lin_ivl.name in {'P1'}:
-        return True
-    else:
-        return False
+    return (n1.pitch.diatonicNoteNum == n2.pitch.diatonicNoteNum
+            and n1.pitch.ps == n2.pitch.ps)
 
 
 def isOctave(n1, n2):
@@ -1947,12 +2320,11 @@ def isOctave(n1, n2):
     the actual interval is in the list:
     'P8', 'P15', 'P22'.
     """
-    # TODO perhaps change this to lin_ivl.semiSimpleName == 'P8'
-    lin_ivl = interval.Interval(n1, n2)
-    if lin_ivl.name in {'P8', 'P15', 'P22'}:
-        return True
-    else:
-        return False
+    # TODO perhaps change this to semiSimpleName == 'P8'
+    # One to three octaves by letter name, with twelve semitones to each.
+    diatonic = n2.pitch.diatonicNoteNum - n1.pitch.diatonicNoteNum
+    semitones = n2.pitch.ps - n1.pitch.ps
+    return abs(diatonic) in (7, 14, 21) and semitones * 7 == diatonic * 12
 
 
 # Methods for voice-leading quartets
@@ -1962,26 +2334,22 @@ def isSimilarUnison(vlq):
     """
     Input a VLQ and determine whether there is similar motion to a unison.
     """
-    rules = [vlq.similarMotion(),
-             vlq.vIntervals[1] != vlq.vIntervals[0],
-             vlq.vIntervals[1].name == 'P1']
-    if all(rules):
-        return True
-    else:
-        return False
+    # Test the names of the intervals, already known to the VLQ,
+    # before the more costly test of the motion.
+    return (vlq.vIntervals[1].name == 'P1'
+            and vlq.vIntervals[1] != vlq.vIntervals[0]
+            and vlq.similarMotion())
 
 
 def isSimilarFromUnison(vlq):
     """
     Input a VLQ and determine whether there is similar motion from a unison.
     """
-    rules = [vlq.similarMotion(),
-             vlq.vIntervals[1] != vlq.vIntervals[0],
-             vlq.vIntervals[0].name == 'P1']
-    if all(rules):
-        return True
-    else:
-        return False
+    # Test the names of the intervals, already known to the VLQ,
+    # before the more costly test of the motion.
+    return (vlq.vIntervals[0].name == 'P1'
+            and vlq.vIntervals[1] != vlq.vIntervals[0]
+            and vlq.similarMotion())
 
 
 def isSimilarFifth(vlq):
@@ -1989,13 +2357,11 @@ def isSimilarFifth(vlq):
     Input a VLQ and determine whether there is similar motion to
     a perfect fifth (simple or compound).
     """
-    rules = [vlq.similarMotion(),
-             vlq.vIntervals[1] != vlq.vIntervals[0],
-             vlq.vIntervals[1].simpleName == 'P5']
-    if all(rules):
-        return True
-    else:
-        return False
+    # Test the names of the intervals, already known to the VLQ,
+    # before the more costly test of the motion.
+    return (vlq.vIntervals[1].simpleName == 'P5'
+            and vlq.vIntervals[1] != vlq.vIntervals[0]
+            and vlq.similarMotion())
 
 
 def isSimilarOctave(vlq):
@@ -2003,13 +2369,36 @@ def isSimilarOctave(vlq):
     Input a VLQ and determine whether there is similar motion to
     an octave (simple or compound).
     """
-    rules = [vlq.similarMotion(),
-             vlq.vIntervals[1] != vlq.vIntervals[0],
-             vlq.vIntervals[1].name in ['P8', 'P15', 'P22']]
-    if all(rules):
-        return True
+    # Test the names of the intervals, already known to the VLQ,
+    # before the more costly test of the motion.
+    return (vlq.vIntervals[1].name in octaveNames
+            and vlq.vIntervals[1] != vlq.vIntervals[0]
+            and vlq.similarMotion())
+
+
+def getParallelInterval(vlq):
+    """
+    Input a VLQ and determine in one pass whether there is parallel
+    motion to a unison, an octave (simple or compound), or a perfect
+    fifth (simple or compound). Return 'P1', 'P8', or 'P5' accordingly,
+    and otherwise None.  :py:func:`isParallelUnison`,
+    :py:func:`isParallelOctave`, and :py:func:`isParallelFifth`
+    each test for one of these.
+    """
+    # Test the name of the arrival interval, already known to the VLQ,
+    # before the more costly test of the motion.
+    arrival = vlq.vIntervals[1]
+    if arrival.name == 'P1':
+        parallel = 'P1'
+    elif arrival.name in octaveNames:
+        parallel = 'P8'
+    elif arrival.simpleName == 'P5':
+        parallel = 'P5'
     else:
-        return False
+        return None
+    if not vlq.parallelMotion():
+        return None
+    return parallel
 
 
 def isParallelUnison(vlq):
@@ -2017,12 +2406,7 @@ def isParallelUnison(vlq):
     Input a VLQ and determine whether there is parallel motion
     from one unison to another.
     """
-    rules = [vlq.parallelMotion(),
-             vlq.vIntervals[1].name in ['P1']]
-    if all(rules):
-        return True
-    else:
-        return False
+    return getParallelInterval(vlq) == 'P1'
 
 
 def isParallelFifth(vlq):
@@ -2030,12 +2414,7 @@ def isParallelFifth(vlq):
     Input a VLQ and determine whether there is parallel motion
     to a perfect fifth (the first fifth need not be perfect).
     """
-    rules = [vlq.parallelMotion(),
-             vlq.vIntervals[1].simpleName == 'P5']
-    if all(rules):
-        return True
-    else:
-        return False
+    return getParallelInterval(vlq) == 'P5'
 
 
 def isParallelOctave(vlq):
@@ -2043,12 +2422,7 @@ def isParallelOctave(vlq):
     Input a VLQ and determine whether there is parallel motion
     from one octave (simple or compound) to another.
     """
-    rules = [vlq.parallelMotion(),
-             vlq.vIntervals[1].name in ['P8', 'P15', 'P22']]
-    if all(rules):
-        return True
-    else:
-        return False
+    return getParallelInterval(vlq) == 'P8'
 
 
 def isVoiceOverlap(vlq):
@@ -2056,16 +2430,17 @@ def isVoiceOverlap(vlq):
     Input a VLQ and determine whether the voices overlap:
      v1n1 >= v2n1 and v1n2 >= v2n2, and either v1n2 < v2n1 or v2n2 > v1n1.
     """
+    # Compare the pitches themselves: music21 orders pitches by pitch
+    # space for < and >, but >= holds only for a higher pitch or the same
+    # spelling, so an enharmonic unison (e.g., E4 and F-4) is not >=.
+    p11 = vlq.v1n1.pitch
+    p12 = vlq.v1n2.pitch
+    p21 = vlq.v2n1.pitch
+    p22 = vlq.v2n2.pitch
     # parts stay in the proper registral position
-    rules1 = [vlq.v1n1.pitch >= vlq.v2n1.pitch,
-              vlq.v1n2.pitch >= vlq.v2n2.pitch]
     # then one part moves beyond where the other was
-    rules2 = [vlq.v1n2.pitch < vlq.v2n1.pitch,
-              vlq.v2n2.pitch > vlq.v1n1.pitch]
-    if all(rules1) and any(rules2):
-        return True
-    else:
-        return False
+    return (p11 >= p21 and p12 >= p22
+            and (p12 < p21 or p22 > p11))
 
 
 def isVoiceCrossing(vlq):
@@ -2074,13 +2449,9 @@ def isVoiceCrossing(vlq):
     the voices cross: v1n1 >= v2n1, and v1n2 < v2n2.
     """
     # parts start out in the proper registral position
-    rules1 = [vlq.v1n1.pitch >= vlq.v2n1.pitch]
-    # then switch
-    rules2 = [vlq.v1n2.pitch < vlq.v2n2.pitch]
-    if all(rules1) and all(rules2):
-        return True
-    else:
-        return False
+    # then switch; the pitches are compared as in isVoiceOverlap
+    return (vlq.v1n1.pitch >= vlq.v2n1.pitch
+            and vlq.v1n2.pitch < vlq.v2n2.pitch)
 
 
 def isCrossRelation(vlq):
@@ -2089,12 +2460,14 @@ def isCrossRelation(vlq):
     The test determines whether the simple interval of either contiguous
     interval is in the list: 'd1', 'A1'.
     """
-    rules = [interval.Interval(vlq.v1n1, vlq.v2n2).simpleName in ['d1', 'A1'],
-             interval.Interval(vlq.v2n1, vlq.v1n2).simpleName in ['d1', 'A1']]
-    if any(rules):
-        return True
-    else:
-        return False
+    # A simple interval is a d1 or A1 just when the two pitches have the
+    # same letter name and their accidentals differ by one semitone.
+    p11 = vlq.v1n1.pitch
+    p12 = vlq.v1n2.pitch
+    p21 = vlq.v2n1.pitch
+    p22 = vlq.v2n2.pitch
+    return ((p11.step == p22.step and abs(p11.alter - p22.alter) == 1)
+            or (p21.step == p12.step and abs(p21.alter - p12.alter) == 1))
 
 
 def isDisplaced(vlq):
@@ -2105,16 +2478,10 @@ def isDisplaced(vlq):
      or consecutive
      interval is not in the list: 'P1', 'm3', 'M3', 'P4', 'P5', 'm6', 'M6'.
      """
-    intervals = [interval.Interval(vlq.v1n1, vlq.v1n2).simpleName,
-                 interval.Interval(vlq.v1n1, vlq.v2n1).simpleName,
-                 interval.Interval(vlq.v2n1, vlq.v2n2).simpleName,
-                 interval.Interval(vlq.v2n1, vlq.v1n2).simpleName]
-    displacements = [i for i in intervals if i
-                     not in ['P1', 'm3', 'M3', 'P4', 'P5', 'm6', 'M6', 'P8']]
-    if displacements == []:
-        return False
-    else:
-        return True
+    pairs = [(vlq.v1n1, vlq.v1n2), (vlq.v1n1, vlq.v2n1),
+             (vlq.v2n1, vlq.v2n2), (vlq.v2n1, vlq.v1n2)]
+    return any(getIntervalNames(n1, n2).simpleName not in undisplacingNames
+               for n1, n2 in pairs)
 
 
 # Methods for notes
@@ -2122,38 +2489,62 @@ def isDisplaced(vlq):
 
 def isOnbeat(note):
     """Tests whether a note is initiated on the downbeat."""
-    rules = [note.beat == 1.0]
-    if any(rules):
-        return True
-    else:
-        return False
+    return getBeat(note) == 1.0
 
 
-def isSyncopated(score, note):
-    """Test whether a note is syncopated. [Not yet functional]"""
+def indexTiedLengths(part):
+    """
+    Store on each note of a part its length together with the notes
+    tied over from it, in one pass over the part.  Notes that are tied
+    over have no independent length and get 0.
+    """
+    chainStart = None
+    for n in part.recurse().notes:
+        if n.tie is None or n.tie.type == 'start':
+            n.tiedLength = n.quarterLength
+            chainStart = n if n.tie is not None else None
+        else:
+            # continue or stop
+            n.tiedLength = 0
+            if chainStart is not None:
+                chainStart.tiedLength += n.quarterLength
+            if n.tie.type == 'stop':
+                chainStart = None
+
+
+def isSyncopated(score, note, ts=None):
+    """Test whether a note is syncopated. [Not yet functional]
+    The time signature of the score may be supplied, if already known;
+    otherwise the first one in the score is found and stored on the score.
+    """
     # TODO This is a first attempt at defining the syncopation property.
     # Given a time signature and music21's default metric system for it.
     # This works for duple simple meter, not sure about compound or triple.
 
     # Get the time signature.
-    ts = score.recurse().getElementsByClass(meter.TimeSignature)[0]
+    if ts is None:
+        if not hasattr(score, 'firstTimeSignature'):
+            # Stop at the first one found, and leave the active sites
+            # of the elements passed over alone.
+            score.firstTimeSignature = score.recurse(
+                restoreActiveSites=False).getElementsByClass(
+                meter.TimeSignature).first()
+        ts = score.firstTimeSignature
 
     # Determine the length of the note.
     # Tied-over notes have no independent duration.
-    if note.tie is None:
-        note.len = note.quarterLength
-    elif note.tie.type == 'start':
-        note.len = note.quarterLength + note.next().quarterLength
-    elif note.tie.type == 'stop':
-        note.len = 0
+    if not hasattr(note, 'tiedLength'):
+        for part in score.parts:
+            indexTiedLengths(part)
+    noteLength = note.tiedLength
     # Find the maximum metrically stable duration of a note initiated at t.
-    maxlen = (note.beatStrength
+    maxlen = (getBeatStrength(note)
               * note.beatDuration.quarterLength
               * ts.beatCount)
     # Determine whether the note is syncopated.
-    if note.len > maxlen:
+    if noteLength > maxlen:
         return True
-    elif note.len == 0:
+    elif noteLength == 0:
         return None
     else:
         return False
@@ -2166,107 +2557,216 @@ def isSyncopated(score, note):
 
 class Test(unittest.TestCase):
 
+    @classmethod
+    def setUpClass(cls):
+        # Notes shared by the interval and VLQ tests.
+        for name in ['G3', 'A3', 'B3', 'C4', 'D4', 'E4', 'F4', 'G4',
+                     'A4', 'Bb4', 'B4', 'C5', 'D5']:
+            setattr(cls, name, note.Note(name))
+
     def runTest(self):
         pass
 
-    def test_UnifiedIntervalTests(self):
-        G3 = note.Note('G3')
-        A3 = note.Note('A3')
-        B3 = note.Note('B3')
-        C4 = note.Note('C4')
-        D4 = note.Note('D4')
-        E4 = note.Note('E4')
-        F4 = note.Note('F4')
-        G4 = note.Note('G4')
-        A4 = note.Note('A4')
-        B4 = note.Note('B4')
-        C5 = note.Note('C5')
-        D5 = note.Note('D5')
-
-        self.assertFalse(isConsonanceAboveBass(G3, C4))
-        self.assertTrue(isConsonanceAboveBass(G3, D4))
-
-        self.assertTrue(isThirdOrSixthAboveBass(G3, B3))
-        self.assertFalse(isThirdOrSixthAboveBass(G3, C4))
-        self.assertTrue(isThirdOrSixthAboveBass(G3, E4))
-
-        self.assertFalse(isConsonanceBetweenUpper(F4, B4))
-        self.assertTrue(isConsonanceBetweenUpper(D4, B4))
-
-        self.assertTrue(isPermittedDissonanceBetweenUpper(F4, B4))
-        self.assertFalse(isPermittedDissonanceBetweenUpper(F4, G4))
-
-        self.assertFalse(isTriadicConsonance(F4, B4))
-        self.assertTrue(isTriadicConsonance(D4, B4))
-
-        self.assertFalse(isTriadicInterval(F4, G4))
-        self.assertTrue(isTriadicInterval(F4, B4))
-        self.assertTrue(isTriadicInterval(C4, C5))
-
-        self.assertTrue(isPerfectVerticalConsonance(C4, G4))
-        self.assertFalse(isPerfectVerticalConsonance(D4, G4))
-
-        self.assertTrue(isImperfectVerticalConsonance(D4, B4))
-        self.assertFalse(isImperfectVerticalConsonance(D4, A4))
+    def test_addError(self):
+        # Each context keeps its own errors.
+        context1 = stream.Score()
+        context2 = stream.Score()
+        context1.vlErrors = []
+        context2.vlErrors = []
+        addError(context1, 'parallelToFifth', 3)
+        self.assertEqual(context1.vlErrors, [('parallelToFifth', (3,))])
+        self.assertEqual(context2.vlErrors, [])
+
+    def test_renderError(self):
+        self.assertEqual(renderError(('parallelToFifth', (3,))),
+                         'Forbidden parallel motion to fifth going '
+                         'into bar 3.')
+        self.assertEqual(renderError(('syncopeNotPermitted', (5, 'M9-8'))),
+                         'The dissonant syncopation in bar 5 is not '
+                         'permitted: M9-8.')
+
+    def test_getIntervalNames(self):
+        pairs = [('C4', 'E4'), ('E4', 'C4'), ('C4', 'F-4'), ('C4', 'D#4'),
+                 ('C4', 'E-4'), ('B3', 'C#5'), ('G#3', 'F4'), ('C4', 'C4'),
+                 ('C4', 'C5'), ('C4', 'B#3'), ('F4', 'B4'), ('B3', 'F4')]
+        for p1, p2 in pairs:
+            n1 = note.Note(p1)
+            n2 = note.Note(p2)
+            ivl = interval.Interval(n1, n2)
+            for trial in range(2):
+                names = getIntervalNames(n1, n2)
+                self.assertEqual(names.name, ivl.name)
+                self.assertEqual(names.simpleName, ivl.simpleName)
+                self.assertEqual(names.semiSimpleName, ivl.semiSimpleName)
 
-        self.assertTrue(isVerticalDissonance(F4, B4))
-        self.assertFalse(isVerticalDissonance(D4, B4))
-
-        self.assertTrue(isDiatonicStep(F4, G4))
-        self.assertFalse(isDiatonicStep(F4, A4))
-
-        self.assertTrue(isUnison(G4, G4))
-        self.assertFalse(isUnison(C4, C5))
-
-        self.assertFalse(isOctave(G4, G4))
-        self.assertTrue(isOctave(C4, C5))
+    def test_UnifiedIntervalTests(self):
+        # (predicate, first note, second note, expected result)
+        cases = [
+            (isConsonanceAboveBass, 'G3', 'C4', False),
+            (isConsonanceAboveBass, 'G3', 'D4', True),
+            (isThirdOrSixthAboveBass, 'G3', 'B3', True),
+            (isThirdOrSixthAboveBass, 'G3', 'C4', False),
+            (isThirdOrSixthAboveBass, 'G3', 'E4', True),
+            (isConsonanceBetweenUpper, 'F4', 'B4', False),
+            (isConsonanceBetweenUpper, 'D4', 'B4', True),
+            (isPermittedDissonanceBetweenUpper, 'F4', 'B4', True),
+            (isPermittedDissonanceBetweenUpper, 'F4', 'G4', False),
+            (isTriadicConsonance, 'F4', 'B4', False),
+            (isTriadicConsonance, 'D4', 'B4', True),
+            (isTriadicInterval, 'F4', 'G4', False),
+            (isTriadicInterval, 'F4', 'B4', True),
+            (isTriadicInterval, 'C4', 'C5', True),
+            (isPerfectVerticalConsonance, 'C4', 'G4', True),
+            (isPerfectVerticalConsonance, 'D4', 'G4', False),
+            (isImperfectVerticalConsonance, 'D4', 'B4', True),
+            (isImperfectVerticalConsonance, 'D4', 'A4', False),
+            (isVerticalDissonance, 'F4', 'B4', True),
+            (isVerticalDissonance, 'D4', 'B4', False),
+            (isDiatonicStep, 'F4', 'G4', True),
+            (isDiatonicStep, 'F4', 'A4', False),
+            (isUnison, 'G4', 'G4', True),
+            (isUnison, 'C4', 'C5', False),
+            (isOctave, 'G4', 'G4', False),
+            (isOctave, 'C4', 'C5', True),
+        ]
+        for predicate, name1, name2, expected in cases:
+            with self.subTest(predicate=predicate.__name__,
+                              notes=(name1, name2)):
+                self.assertEqual(predicate(getattr(self, name1),
+                                           getattr(self, name2)),
+                                 expected)
+
+    def test_consonanceOfEnharmonicSpellings(self):
+        # An augmented second spans a consonant semitone class but
+        # is dissonant, and a diminished fifth spans no consonant class.
+        d4 = note.Note('D4')
+        eSharp4 = note.Note('E#4')
+        bb4 = note.Note('B-4')
+        e4 = note.Note('E4')
+        self.assertTrue(isVerticalDissonance(d4, eSharp4))
+        self.assertFalse(isConsonanceBetweenUpper(d4, eSharp4))
+        self.assertFalse(isTriadicConsonance(d4, eSharp4))
+        self.assertTrue(isVerticalDissonance(e4, bb4))
+        self.assertFalse(isConsonanceBetweenUpper(e4, bb4))
+
+    def test_voiceOverlapAndCrossingWithEnharmonicUnison(self):
+        # An enharmonic unison (E4 against F-4) is not taken as the
+        # proper registral position, but a spelled unison is.
+        e4, fFlat4 = note.Note('E4'), note.Note('F-4')
+        e4b = note.Note('E4')
+        c4, d4 = note.Note('C4'), note.Note('D4')
+        f4, g4 = note.Note('F4'), note.Note('G4')
+        VLQ = voiceLeading.VoiceLeadingQuartet
+        self.assertFalse(isVoiceOverlap(VLQ(e4, g4, fFlat4, f4)))
+        self.assertTrue(isVoiceOverlap(VLQ(e4, g4, e4b, f4)))
+        self.assertFalse(isVoiceCrossing(VLQ(e4, c4, fFlat4, d4)))
+        self.assertTrue(isVoiceCrossing(VLQ(e4, c4, e4b, d4)))
+
+    def test_getMotionCode(self):
+        line = [note.Note(n) for n in ['C4', 'D4', 'E4', 'F4', 'D4']]
+        for i, n in enumerate(line):
+            n.index = i
+        from westerparse.consecutions import Consecutions
+        for n in line:
+            n.consecutions = Consecutions(
+                n,
+                line[n.index - 1] if n.index > 0 else None,
+                line[n.index + 1] if n.index < len(line) - 1 else None)
+        n1, n2, n3, n4, n5 = line
+        # Approached and left upward: (1 + 1) * 4 + (1 + 1).
+        self.assertEqual(getMotionCode(n2), 10)
+        # Not approached, left upward: (2 + 1) * 4 + (1 + 1).
+        self.assertEqual(getMotionCode(n1), 14)
+        # Notes with the same motion share a code; others do not.
+        self.assertEqual(getMotionCode(n2), getMotionCode(n3))
+        self.assertNotEqual(getMotionCode(n3), getMotionCode(n4))
+        self.assertNotEqual(getMotionCode(n1), getMotionCode(n2))
+
+    def test_getNoteAtOffset(self):
+        part = stream.Part()
+        for n in ['C4', 'D4', 'E4']:
+            part.append(note.Note(n, type='whole'))
+        indexNoteOffsets(part)
+        self.assertEqual(getNoteAtOffset(part, 0.0).name, 'C')
+        self.assertEqual(getNoteAtOffset(part, 2.0).name, 'C')
+        self.assertEqual(getNoteAtOffset(part, 4.0).name, 'D')
+        self.assertEqual(getNoteAtOffset(part, 11.5).name, 'E')
+        self.assertIsNone(getNoteAtOffset(part, 12.0))
+        # Triplets, looked up at the float offsets of the timespans,
+        # in a part that has not yet been indexed.
+        part = stream.Part()
+        for n in ['E4', 'F4', 'G4']:
+            part.append(note.Note(n, quarterLength=common.opFrac(2 / 3)))
+        part.append(note.Note('C4', type='half'))
+        self.assertEqual(getNoteAtOffset(part, 2 / 3).name, 'F')
+        self.assertEqual(getNoteAtOffset(part, 4 / 3).name, 'G')
+        self.assertEqual(getNoteAtOffset(part, 2.0).name, 'C')
+        self.assertIsNone(getNoteAtOffset(part, 4.0))
+
+    def test_getNotesInSpan(self):
+        part = stream.Part()
+        for n in ['C4', 'D4', 'E4', 'F4']:
+            part.append(note.Note(n, type='half'))
+        part.makeMeasures(inPlace=True)
+        measureIndex = indexMeasureNotes(part)
+        bars = getMeasuresInSpan(measureIndex, 2.0, 6.0)
+        self.assertEqual([offset for offset, bar in bars], [0.0, 4.0])
+        barOffset, bar = bars[1]
+        self.assertEqual([(offset, n.name) for offset, n
+                          in getNotesInSpan(bar, 0.0, 2.0)],
+                         [(0.0, 'E')])
+        self.assertEqual(getNotesInSpan(bar, 4.0, 8.0), [])
 
     def test_unifiedVLQTests(self):
-        G3 = note.Note('G3')
-        A3 = note.Note('A3')
-        B3 = note.Note('B3')
-        C4 = note.Note('C4')
-        D4 = note.Note('D4')
-        E4 = note.Note('E4')
-        F4 = note.Note('F4')
-        G4 = note.Note('G4')
-        A4 = note.Note('A4')
-        Bb4 = note.Note('Bb4')
-        B4 = note.Note('B4')
-        C5 = note.Note('C5')
-        D5 = note.Note('D5')
-
-        a = voiceLeading.VoiceLeadingQuartet(C5, D5, A4, D5)
+        a = voiceLeading.VoiceLeadingQuartet(self.C5, self.D5,
+                                             self.A4, self.D5)
         self.assertTrue(isSimilarUnison(a))
 
-        a = voiceLeading.VoiceLeadingQuartet(D5, C5, D5, A4)
+        a = voiceLeading.VoiceLeadingQuartet(self.D5, self.C5,
+                                             self.D5, self.A4)
         self.assertTrue(isSimilarFromUnison(a))
 
-        a = voiceLeading.VoiceLeadingQuartet(C5, D5, E4, G4)
+        a = voiceLeading.VoiceLeadingQuartet(self.C5, self.D5,
+                                             self.E4, self.G4)
         self.assertTrue(isSimilarFifth(a))
 
-        a = voiceLeading.VoiceLeadingQuartet(B4, C5, G3, C4)
+        a = voiceLeading.VoiceLeadingQuartet(self.B4, self.C5,
+                                             self.G3, self.C4)
         self.assertTrue(isSimilarOctave(a))
 
-        a = voiceLeading.VoiceLeadingQuartet(C4, D4, C4, D4)
+        a = voiceLeading.VoiceLeadingQuartet(self.C4, self.D4,
+                                             self.C4, self.D4)
         self.assertTrue(isParallelUnison(a))
+        self.assertEqual(getParallelInterval(a), 'P1')
 
-        a = voiceLeading.VoiceLeadingQuartet(G4, A4, C4, D4)
+        a = voiceLeading.VoiceLeadingQuartet(self.G4, self.A4,
+                                             self.C4, self.D4)
         self.assertTrue(isParallelFifth(a))
+        self.assertEqual(getParallelInterval(a), 'P5')
 
-        a = voiceLeading.VoiceLeadingQuartet(C5, D5, C4, D4)
+        a = voiceLeading.VoiceLeadingQuartet(self.C5, self.D5,
+                                             self.C4, self.D4)
         self.assertTrue(isParallelOctave(a))
+        self.assertEqual(getParallelInterval(a), 'P8')
+
+        a = voiceLeading.VoiceLeadingQuartet(self.B4, self.C5,
+                                             self.G3, self.C4)
+        self.assertIsNone(getParallelInterval(a))
 
-        a = voiceLeading.VoiceLeadingQuartet(G4, D5, F4, A4)
+        a = voiceLeading.VoiceLeadingQuartet(self.G4, self.D5,
+                                             self.F4, self.A4)
         self.assertTrue(isVoiceOverlap(a))
 
-        a = voiceLeading.VoiceLeadingQuartet(G4, A4, E4, C5)
+        a = voiceLeading.VoiceLeadingQuartet(self.G4, self.A4,
+                                             self.E4, self.C5)
         self.assertTrue(isVoiceCrossing(a))
 
-        a = voiceLeading.VoiceLeadingQuartet(B3, C4, G4, Bb4)
+        a = voiceLeading.VoiceLeadingQuartet(self.B3, self.C4,
+                                             self.G4, self.Bb4)
         self.assertTrue(isCrossRelation(a))
 
-        a = voiceLeading.VoiceLeadingQuartet(C4, G3, C5, B4)
+        a = voiceLeading.VoiceLeadingQuartet(self.C4, self.G3,
+                                             self.C5, self.B4)
         self.assertTrue(isDisplaced(a))
 
     def test_isOnbeat(self):
@@ -2275,6 +2775,21 @@ class Test(unittest.TestCase):
     def test_isSyncopated(self):
         pass
 
+    def test_indexTiedLengths(self):
+        p = stream.Part()
+        n1 = note.Note('C4', quarterLength=2.0)
+        n2 = note.Note('C4', quarterLength=2.0)
+        n3 = note.Note('C4', quarterLength=1.0)
+        n4 = note.Note('D4', quarterLength=1.0)
+        n1.tie = tie.Tie('start')
+        n2.tie = tie.Tie('continue')
+        n3.tie = tie.Tie('stop')
+        for n in [n1, n2, n3, n4]:
+            p.append(n)
+        indexTiedLengths(p)
+        self.assertEqual([n.tiedLength for n in [n1, n2, n3, n4]],
+                         [5.0, 0, 0, 1.0])
+
     def test_checkPartPairs(self):
         pass
 
@@ -2323,8 +2838,22 @@ class Test(unittest.TestCase):
     def test_checkFourthLeapsInBass(self):
         pass
 
+    def test_getGenericSemiSimpleUndirected(self):
+        for bass, upper in [('C3', 'C3'), ('C3', 'G3'), ('C3', 'C4'),
+                            ('C3', 'E4'), ('C3', 'C5'), ('G3', 'C3'),
+                            ('B2', 'C#5')]:
+            n1 = note.Note(bass)
+            n2 = note.Note(upper)
+            self.assertEqual(
+                getGenericSemiSimpleUndirected(n1, n2),
+                interval.Interval(n1, n2).generic.semiSimpleUndirected)
+
     def test_getAllPartNumPairs(self):
-        pass
+        score = stream.Score()
+        for i in range(4):
+            score.insert(0, stream.Part())
+        self.assertEqual(getAllPartNumPairs(score),
+                         [(0, 1), (0, 2), (0, 3), (1, 2), (1, 3), (2, 3)])
 
     def test_getVerticalitiesFromDuet(self):
         pass
@@ -2336,7 +2865,43 @@ class Test(unittest.TestCase):
         pass
 
     def test_getVerticalPairs(self):
-        pass
+        # Triplets in the upper part, and a lower part that ends early.
+        def makeDuet():
+            duet = stream.Score()
+            upper = stream.Part()
+            lower = stream.Part()
+            for n in ['E4', 'F4', 'G4']:
+                upper.append(note.Note(n, quarterLength=common.opFrac(2 / 3)))
+            upper.append(note.Note('A4', type='half'))
+            lower.append(note.Note('C4', type='half'))
+            duet.insert(0, upper)
+            duet.insert(0, lower)
+            return duet
+        vPairs = getVerticalPairs(makeDuet())
+        self.assertEqual([(n1.name, n2.name) for n1, n2 in vPairs],
+                         [('E', 'C'), ('F', 'C'), ('G', 'C')])
+        # The pairs do not depend on which function builds them first.
+        self.assertEqual([(n1.name, n2.name) for n1, n2
+                          in getVerticalPairsAndVLQs(makeDuet())[0]],
+                         [(n1.name, n2.name) for n1, n2 in vPairs])
+
+    def test_getVerticalPairsAndVLQs(self):
+        duet = stream.Score()
+        upper = stream.Part()
+        lower = stream.Part()
+        for n in ['E4', 'F4', 'G4']:
+            upper.append(note.Note(n, type='whole'))
+        for n in ['C4', 'D4', 'C4']:
+            lower.append(note.Note(n, type='whole'))
+        duet.insert(0, upper)
+        duet.insert(0, lower)
+        vPairs, VLQs = getVerticalPairsAndVLQs(duet)
+        self.assertEqual(len(vPairs), 3)
+        self.assertEqual(len(VLQs), 2)
+        self.assertIs(VLQs[1].v1n1, vPairs[1][0])
+        self.assertIs(VLQs[1].v2n2, vPairs[2][1])
+        self.assertEqual([vlq.v1n2 for vlq in VLQs],
+                         [vlq.v1n2 for vlq in getAllVLQsFromDuet(duet)])
 
     def test_getAllVLQsFromDuet(self):
         pass
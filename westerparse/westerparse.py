@@ -41,7 +41,6 @@ from music21 import *
 from westerparse import context
 from westerparse import parser
 from westerparse import vlChecker
-from westerparse import utilities
 
 # -----------------------------------------------------------------------------
 # LOGGER
@@ -204,10 +203,9 @@ def evaluateCounterpoint(source,
     except context.EvaluationException as ee:
         ee.show()
     else:
-        vlChecker.vlErrors = []
         vlChecker.checkCounterpoint(cxt, report)
         if not report:
-            if vlChecker.vlErrors:
+            if cxt.vlErrors:
                 return False
             else:
                 return True
@@ -453,30 +451,19 @@ def checkFinalStep(part, cxt):
     ultimaNote = part.recurse().notes[-1]
     # Collect the notes in the penultimate bar of the upper line.
     penultBar = part.getElementsByClass(stream.Measure)[-2].notes
-    buffer = []
-    stack = []
-
-    # Fill buffer with notes of penultimate bar in reverse.
-    for n in reversed(penultBar):
-        buffer.append(n)
-    blen = len(buffer)
-    # Start looking for a viable step connection.
-    while blen > 0:
-        if vlChecker.isDiatonicStep(ultimaNote, buffer[0]):
-            # Check penultimate note.
-            if len(stack) == 0:
-                finalStepConnection = True
-                break
-            # Check other notes, if needed.
-            elif len(stack) > 0:
-                for s in stack:
-                    if vlChecker.isDiatonicStep(s, buffer[0]):
-                        finalStepConnection = False
-                        break
-                    else:
-                        finalStepConnection = True
-        utilities.shiftBuffer(stack, buffer)
-        blen = len(buffer)
+    # Look for a viable step connection, reading the bar in reverse.
+    penultNotes = list(reversed(penultBar))
+    for i, n in enumerate(penultNotes):
+        if not vlChecker.isDiatonicStep(ultimaNote, n):
+            continue
+        # Check penultimate note.
+        if i == 0:
+            finalStepConnection = True
+            break
+        # Check other notes: the connection holds only if no later note
+        # in the bar is a step away from this one.
+        finalStepConnection = not any(vlChecker.isDiatonicStep(s, n)
+                                      for s in penultNotes[:i])
     # Write an error in the context error dictionary for this part
     # and set isPrimary to False
     if not finalStepConnection:  # ultimaNote.csd.value % 7 == 0